@@ -4,59 +4,250 @@ Grid Intelligence Database Creator
 Creates structured database from analyzed document data for ArcGIS Online integration
 """
 
+import hashlib
 import json
 import pandas as pd
 import sqlite3
+import time
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Optional, Set, Tuple
 import logging
 
+from grid_document_analyzer import read_jsonl
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Fact tables whose rows are owned by a single source document
+FACT_TABLES = ('grid_capacity', 'grid_connections', 'grid_constraints', 'investment_projects')
+
+# Full-text index over the description column of every fact table
+SEARCH_TABLE = 'grid_text_search'
+
+# Summary views that can be materialized as <view>_mv tables
+SUMMARY_VIEWS = ('high_capacity_projects', 'connection_summary', 'investment_timeline')
+
 class GridIntelligenceDatabase:
     """
     Creates and manages structured grid intelligence database
     """
     
-    def __init__(self, data_file: str = "data/grid_intelligence_analysis.json"):
-        """Initialize database creator"""
+    def __init__(self, data_file: str = "data/grid_intelligence_analysis.json",
+                 chunk_size: int = 10000, cache_size_kib: int = 256 * 1024,
+                 materialize_views: bool = False):
+        """
+        Initialize database creator
+        
+        Args:
+            data_file: Analysis results, either the JSON export or a streamed
+                       JSONL export (.jsonl), which is read record by record
+            chunk_size: Rows per executemany batch during bulk loads
+            cache_size_kib: SQLite page cache size used during bulk loads
+            materialize_views: Also store the summary views as tables
+                               (<view>_mv) refreshed at the end of each load,
+                               so dashboard reads do not re-aggregate
+        """
         self.data_file = Path(data_file)
         self.db_path = Path("data/grid_intelligence.db")
+        self.chunk_size = chunk_size
+        self.cache_size_kib = cache_size_kib
+        self.materialize_views = materialize_views
+        self.search_enabled = False
+        self.search_index_created = False
+        self.streaming = self.data_file.suffix == '.jsonl'
+        
+        # Load the analyzed document data (JSONL exports are streamed on demand)
+        self.analysis_data = None
+        if not self.streaming:
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                self.analysis_data = json.load(f)
+
+    def iter_records(self, record_type: str, sources: Optional[Set[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over extracted records of one type, tagged with their document_source
+        
+        Args:
+            record_type: 'capacity', 'connection', 'constraint' or 'investment'
+            sources: Only yield records of these documents (all documents if not given)
+        """
+        if sources is not None and not sources:
+            return
+        
+        if self.streaming:
+            for record in read_jsonl(self.data_file, [record_type]):
+                if sources is None or record.get('document_source') in sources:
+                    yield record
+            return
         
-        # Load the analyzed document data
-        with open(self.data_file, 'r', encoding='utf-8') as f:
-            self.analysis_data = json.load(f)
+        for filename, doc_data in self.analysis_data['document_summaries'].items():
+            if sources is not None and filename not in sources:
+                continue
+            for item in doc_data.get(f'{record_type}_info', []):
+                yield dict(item, document_source=filename)
 
-    def create_database(self):
-        """Create SQLite database with structured grid intelligence data"""
+    def iter_documents(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over (filename, page/record counts and content_hash) of the analyzed documents"""
+        if self.streaming:
+            for record in read_jsonl(self.data_file, ['document']):
+                yield record['file_name'], record
+            return
+        
+        for filename, doc_data in self.analysis_data['document_summaries'].items():
+            content = json.dumps(doc_data, sort_keys=True, ensure_ascii=False, default=str)
+            yield filename, {
+                'pages_processed': doc_data.get('pages_processed', 0),
+                'capacity_points': len(doc_data.get('capacity_info', [])),
+                'connection_points': len(doc_data.get('connection_info', [])),
+                'constraint_points': len(doc_data.get('constraint_info', [])),
+                'investment_points': len(doc_data.get('investment_info', [])),
+                'content_hash': hashlib.sha256(content.encode('utf-8')).hexdigest()
+            }
+
+    def create_database(self, incremental: bool = False) -> Dict[str, Dict[str, float]]:
+        """
+        Create SQLite database with structured grid intelligence data
+        
+        Args:
+            incremental: Only replace the rows of documents whose content hash
+                         changed since the last load; unchanged documents are
+                         not touched. Otherwise all data is reloaded from scratch.
+        
+        Returns:
+            Per-table load statistics (rows, seconds, rows_per_sec)
+        """
         logger.info("Creating grid intelligence database...")
         
         # Connect to SQLite database
         conn = sqlite3.connect(self.db_path)
         
         try:
+            self.apply_bulk_load_pragmas(conn)
+            
             # Create tables
             self.create_tables(conn)
             
-            # Insert data
-            self.insert_capacity_data(conn)
-            self.insert_connection_data(conn)
-            self.insert_constraint_data(conn)
-            self.insert_investment_data(conn)
-            self.insert_document_metadata(conn)
+            documents = dict(self.iter_documents())
+            if incremental and self.has_content_hashes(conn):
+                sources = self.find_changed_documents(conn, documents)
+                self.delete_document_rows(conn, sources)
+            else:
+                if incremental:
+                    logger.info("No document content hashes stored yet - performing full reload")
+                sources = set(documents)
+                self.clear_tables(conn)
+            
+            # Insert data (one transaction for the whole load)
+            load_stats = {
+                'grid_capacity': self.insert_capacity_data(conn, sources),
+                'grid_connections': self.insert_connection_data(conn, sources),
+                'grid_constraints': self.insert_constraint_data(conn, sources),
+                'investment_projects': self.insert_investment_data(conn, sources),
+                'document_metadata': self.insert_document_metadata(
+                    conn, {filename: documents[filename] for filename in documents if filename in sources})
+            }
+            # A newly added search index also needs the unchanged documents
+            self.index_search_text(conn, set(documents) if self.search_index_created else sources)
+            
+            # Build indexes once the data is in
+            self.create_indexes(conn)
             
             # Create summary views
             self.create_views(conn)
+            self.refresh_summary_tables(conn)
             
             conn.commit()
+            self.restore_pragmas(conn)
             logger.info(f"Database created successfully: {self.db_path}")
+            return load_stats
             
         finally:
             conn.close()
 
+    def has_content_hashes(self, conn: sqlite3.Connection) -> bool:
+        """Check whether the database was loaded with per-document content hashes"""
+        return conn.execute(
+            "SELECT 1 FROM document_metadata WHERE content_hash IS NOT NULL LIMIT 1"
+        ).fetchone() is not None
+
+    def find_changed_documents(self, conn: sqlite3.Connection, documents: Dict[str, Dict[str, Any]]) -> Set[str]:
+        """
+        Find documents that are new, removed, or whose content hash differs from
+        the stored one
+        
+        Args:
+            conn: Database connection
+            documents: {filename: counts and content_hash} from the analysis data
+        """
+        stored = dict(conn.execute("SELECT filename, content_hash FROM document_metadata"))
+        changed = {
+            filename for filename, doc in documents.items()
+            if doc.get('content_hash') is None or stored.get(filename) != doc['content_hash']
+        }
+        removed = set(stored) - set(documents)
+        logger.info(f"Incremental refresh: {len(changed)} changed, {len(removed)} removed, "
+                    f"{len(documents) - len(changed)} unchanged documents")
+        return changed | removed
+
+    def delete_document_rows(self, conn: sqlite3.Connection, sources: Set[str]):
+        """Delete the fact and metadata rows of the given source documents"""
+        conn.executemany("DELETE FROM document_metadata WHERE filename = ?",
+                         ((source,) for source in sources))
+        tables = FACT_TABLES + ((SEARCH_TABLE,) if self.search_enabled else ())
+        for table in tables:
+            conn.executemany(f"DELETE FROM {table} WHERE document_source = ?",
+                             ((source,) for source in sources))
+
+    def clear_tables(self, conn: sqlite3.Connection):
+        """Delete all loaded data before a full reload"""
+        for table in FACT_TABLES + ('document_metadata',):
+            conn.execute(f"DELETE FROM {table}")
+        if self.search_enabled:
+            conn.execute(f"DELETE FROM {SEARCH_TABLE}")
+
+    def apply_bulk_load_pragmas(self, conn: sqlite3.Connection):
+        """Tune SQLite for a single large write transaction"""
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute(f"PRAGMA cache_size=-{self.cache_size_kib}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+    def restore_pragmas(self, conn: sqlite3.Connection):
+        """Return to durable settings after a bulk load"""
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+    def bulk_insert(self, conn: sqlite3.Connection, table: str, columns: Tuple[str, ...],
+                    rows: Iterator[Tuple]) -> Dict[str, float]:
+        """
+        Insert row tuples with executemany in fixed-size chunks
+        
+        Args:
+            conn: Database connection (the caller owns the transaction)
+            table: Target table
+            columns: Column names matching the row tuples
+            rows: Row tuple generator
+            
+        Returns:
+            Load statistics for the table
+        """
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        started = time.perf_counter()
+        row_count = 0
+        
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                break
+            conn.executemany(sql, chunk)
+            row_count += len(chunk)
+        
+        elapsed = time.perf_counter() - started
+        rows_per_sec = row_count / elapsed if elapsed > 0 else float(row_count)
+        logger.info(f"Loaded {row_count} rows into {table} in {elapsed:.2f}s ({rows_per_sec:,.0f} rows/sec)")
+        return {'rows': row_count, 'seconds': elapsed, 'rows_per_sec': rows_per_sec}
+
     def create_tables(self, conn: sqlite3.Connection):
         """Create database tables"""
         
@@ -71,6 +262,8 @@ class GridIntelligenceDatabase:
             description TEXT,
             project_name TEXT,
             location TEXT,
+            voltage_kv REAL,
+            commissioning_year INTEGER,
             status TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
@@ -130,20 +323,52 @@ class GridIntelligenceDatabase:
             connection_points INTEGER,
             constraint_points INTEGER,
             investment_points INTEGER,
+            content_hash TEXT,
             analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         """)
-
-    def insert_capacity_data(self, conn: sqlite3.Connection):
-        """Insert grid capacity data"""
-        logger.info("Inserting grid capacity data...")
         
-        for item in self.analysis_data['capacity_data']:
+        # Databases created before incremental refresh lack the hash column
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(document_metadata)")]
+        if 'content_hash' not in columns:
+            conn.execute("ALTER TABLE document_metadata ADD COLUMN content_hash TEXT")
+        
+        # Databases created before table extraction lack the typed table columns
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(grid_capacity)")]
+        if 'voltage_kv' not in columns:
+            conn.execute("ALTER TABLE grid_capacity ADD COLUMN voltage_kv REAL")
+        if 'commissioning_year' not in columns:
+            conn.execute("ALTER TABLE grid_capacity ADD COLUMN commissioning_year INTEGER")
+        
+        # Full-text search index (needs an SQLite build with FTS5)
+        self.search_index_created = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = ?", (SEARCH_TABLE,)
+        ).fetchone() is None
+        try:
+            conn.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+                description,
+                fact_table UNINDEXED,
+                fact_id UNINDEXED,
+                document_source UNINDEXED,
+                page_number UNINDEXED,
+                tokenize = 'unicode61 remove_diacritics 2'
+            )
+            """)
+            self.search_enabled = True
+        except sqlite3.OperationalError as e:
+            self.search_enabled = False
+            logger.warning(f"Full-text search disabled, FTS5 not available: {e}")
+
+    def capacity_rows(self, sources: Optional[Set[str]] = None) -> Iterator[Tuple]:
+        """Generate grid_capacity row tuples"""
+        for item in self.iter_records('capacity', sources):
             # Extract capacity values if available
-            capacity_mw = None
-            capacity_unit = None
+            capacity_mw = item.get('capacity_mw')
+            capacity_unit = 'MW' if capacity_mw is not None else None
             
-            if 'values' in item and item['values']:
+            # Older analysis exports carry only the raw (value, unit) matches
+            if capacity_mw is None and 'values' in item and item['values']:
                 for value, unit in item['values']:
                     # Convert to MW for standardization
                     if unit.upper() == 'GW':
@@ -157,75 +382,79 @@ class GridIntelligenceDatabase:
                         capacity_unit = 'MW'
                     break  # Use first value
             
-            # Extract project/location info from text
+            # Extract project/location info from text; table rows name their substation
             text = item['text']
-            project_name = self.extract_project_name(text)
-            location = self.extract_location(text)
             
-            conn.execute("""
-            INSERT INTO grid_capacity 
-            (document_source, page_number, capacity_mw, capacity_unit, description, project_name, location)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
+            yield (
                 item.get('document_source', 'Unknown'),
                 item.get('page', 0),
                 capacity_mw,
                 capacity_unit,
                 text[:500],  # Truncate long descriptions
-                project_name,
-                location
-            ))
+                item.get('substation') or self.extract_project_name(text),
+                self.extract_location(text),
+                item.get('voltage_kv'),
+                item.get('year')
+            )
 
-    def insert_connection_data(self, conn: sqlite3.Connection):
-        """Insert grid connection data"""
-        logger.info("Inserting grid connection data...")
-        
-        for item in self.analysis_data['connection_data']:
+    def insert_capacity_data(self, conn: sqlite3.Connection,
+                        sources: Optional[Set[str]] = None) -> Dict[str, float]:
+        """Insert grid capacity data"""
+        logger.info("Inserting grid capacity data...")
+        return self.bulk_insert(conn, 'grid_capacity', (
+            'document_source', 'page_number', 'capacity_mw', 'capacity_unit',
+            'description', 'project_name', 'location', 'voltage_kv', 'commissioning_year'
+        ), self.capacity_rows(sources))
+
+    def connection_rows(self, sources: Optional[Set[str]] = None) -> Iterator[Tuple]:
+        """Generate grid_connections row tuples"""
+        for item in self.iter_records('connection', sources):
             text = item['text']
-            connection_type = self.classify_connection_type(text)
-            
-            conn.execute("""
-            INSERT INTO grid_connections 
-            (document_source, page_number, connection_type, description)
-            VALUES (?, ?, ?, ?)
-            """, (
+            yield (
                 item.get('document_source', 'Unknown'),
                 item.get('page', 0),
-                connection_type,
+                self.classify_connection_type(text),
                 text[:500]
-            ))
+            )
 
-    def insert_constraint_data(self, conn: sqlite3.Connection):
-        """Insert grid constraint data"""
-        logger.info("Inserting grid constraint data...")
-        
-        for item in self.analysis_data['constraint_data']:
+    def insert_connection_data(self, conn: sqlite3.Connection,
+                        sources: Optional[Set[str]] = None) -> Dict[str, float]:
+        """Insert grid connection data"""
+        logger.info("Inserting grid connection data...")
+        return self.bulk_insert(conn, 'grid_connections', (
+            'document_source', 'page_number', 'connection_type', 'description'
+        ), self.connection_rows(sources))
+
+    def constraint_rows(self, sources: Optional[Set[str]] = None) -> Iterator[Tuple]:
+        """Generate grid_constraints row tuples"""
+        for item in self.iter_records('constraint', sources):
             text = item['text']
-            constraint_type = self.classify_constraint_type(text)
-            
-            conn.execute("""
-            INSERT INTO grid_constraints 
-            (document_source, page_number, constraint_type, description)
-            VALUES (?, ?, ?, ?)
-            """, (
+            yield (
                 item.get('document_source', 'Unknown'),
                 item.get('page', 0),
-                constraint_type,
+                self.classify_constraint_type(text),
                 text[:500]
-            ))
+            )
 
-    def insert_investment_data(self, conn: sqlite3.Connection):
-        """Insert investment project data"""
-        logger.info("Inserting investment project data...")
-        
-        for item in self.analysis_data['investment_data']:
+    def insert_constraint_data(self, conn: sqlite3.Connection,
+                        sources: Optional[Set[str]] = None) -> Dict[str, float]:
+        """Insert grid constraint data"""
+        logger.info("Inserting grid constraint data...")
+        return self.bulk_insert(conn, 'grid_constraints', (
+            'document_source', 'page_number', 'constraint_type', 'description'
+        ), self.constraint_rows(sources))
+
+    def investment_rows(self, sources: Optional[Set[str]] = None) -> Iterator[Tuple]:
+        """Generate investment_projects row tuples"""
+        for item in self.iter_records('investment', sources):
             text = item['text']
             
             # Extract investment amount
-            investment_amount = None
-            currency = None
+            investment_amount = item.get('cost_eur')
+            currency = 'EUR' if investment_amount is not None else None
             
-            if 'costs' in item and item['costs']:
+            # Older analysis exports carry only the raw (amount, unit) matches
+            if investment_amount is None and 'costs' in item and item['costs']:
                 for amount, curr in item['costs']:
                     investment_amount = float(amount.replace(',', ''))
                     currency = curr
@@ -236,36 +465,139 @@ class GridIntelligenceDatabase:
             if 'years' in item and item['years']:
                 timeline = '-'.join(item['years'])
             
-            conn.execute("""
-            INSERT INTO investment_projects 
-            (document_source, page_number, description, investment_amount, currency, timeline)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """, (
+            yield (
                 item.get('document_source', 'Unknown'),
                 item.get('page', 0),
                 text[:500],
                 investment_amount,
                 currency,
                 timeline
-            ))
+            )
 
-    def insert_document_metadata(self, conn: sqlite3.Connection):
+    def insert_investment_data(self, conn: sqlite3.Connection,
+                        sources: Optional[Set[str]] = None) -> Dict[str, float]:
+        """Insert investment project data"""
+        logger.info("Inserting investment project data...")
+        return self.bulk_insert(conn, 'investment_projects', (
+            'document_source', 'page_number', 'description',
+            'investment_amount', 'currency', 'timeline'
+        ), self.investment_rows(sources))
+
+    def insert_document_metadata(self, conn: sqlite3.Connection,
+                                 documents: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, float]:
         """Insert document analysis metadata"""
         logger.info("Inserting document metadata...")
         
-        for filename, doc_data in self.analysis_data['document_summaries'].items():
-            conn.execute("""
-            INSERT OR REPLACE INTO document_metadata 
-            (filename, pages_processed, capacity_points, connection_points, constraint_points, investment_points)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """, (
+        if documents is None:
+            documents = dict(self.iter_documents())
+        
+        started = time.perf_counter()
+        rows = [
+            (
                 filename,
-                doc_data.get('pages_processed', 0),
-                len(doc_data.get('capacity_info', [])),
-                len(doc_data.get('connection_info', [])),
-                len(doc_data.get('constraint_info', [])),
-                len(doc_data.get('investment_info', []))
-            ))
+                counts.get('pages_processed', 0),
+                counts.get('capacity_points', 0),
+                counts.get('connection_points', 0),
+                counts.get('constraint_points', 0),
+                counts.get('investment_points', 0),
+                counts.get('content_hash')
+            )
+            for filename, counts in documents.items()
+        ]
+        conn.executemany("""
+        INSERT OR REPLACE INTO document_metadata 
+        (filename, pages_processed, capacity_points, connection_points, constraint_points, investment_points,
+         content_hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        
+        elapsed = time.perf_counter() - started
+        return {'rows': len(rows), 'seconds': elapsed,
+                'rows_per_sec': len(rows) / elapsed if elapsed > 0 else float(len(rows))}
+
+    def index_search_text(self, conn: sqlite3.Connection, sources: Set[str]):
+        """Add the descriptions of the given source documents to the full-text index"""
+        if not self.search_enabled:
+            return
+        
+        for table in FACT_TABLES:
+            conn.executemany(f"""
+            INSERT INTO {SEARCH_TABLE} (description, fact_table, fact_id, document_source, page_number)
+            SELECT description, '{table}', id, document_source, page_number
+            FROM {table} WHERE document_source = ? AND description IS NOT NULL
+            """, ((source,) for source in sources))
+        
+        logger.info(f"Indexed text of {len(sources)} documents for full-text search")
+
+    def search(self, query: str, limit: int = 20, raw: bool = False) -> List[Dict[str, Any]]:
+        """
+        Full-text search over the extracted capacity, connection, constraint
+        and investment descriptions
+        
+        Args:
+            query: Search terms; every term must match, e.g. 'Olkiluoto 400 kV'
+            limit: Maximum number of hits
+            raw: Pass the query through as FTS5 syntax (phrases, OR, NEAR, prefix*)
+            
+        Returns:
+            Hits ranked by BM25 relevance, with table, document and page provenance
+        """
+        if not raw:
+            # Quote each term so punctuation such as 'cross-border' is not parsed as syntax
+            query = ' '.join('"' + term.replace('"', '""') + '"' for term in query.split())
+        
+        conn = sqlite3.connect(self.db_path)
+        
+        try:
+            rows = conn.execute(f"""
+            SELECT fact_table, fact_id, document_source, page_number,
+                   snippet({SEARCH_TABLE}, 0, '[', ']', '...', 12), bm25({SEARCH_TABLE})
+            FROM {SEARCH_TABLE}
+            WHERE {SEARCH_TABLE} MATCH ?
+            ORDER BY bm25({SEARCH_TABLE})
+            LIMIT ?
+            """, (query, limit)).fetchall()
+        except sqlite3.OperationalError as e:
+            logger.error(f"Full-text search failed for {query!r}: {e}")
+            return []
+        finally:
+            conn.close()
+        
+        return [
+            {
+                'table': fact_table,
+                'id': fact_id,
+                'document_source': document_source,
+                'page_number': page_number,
+                'snippet': snippet,
+                'score': -score
+            }
+            for fact_table, fact_id, document_source, page_number, snippet, score in rows
+        ]
+
+    def create_indexes(self, conn: sqlite3.Connection):
+        """Create indexes (after the bulk load, so they are built in one pass)"""
+        logger.info("Creating database indexes...")
+        
+        for table in FACT_TABLES:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_document_source ON {table}(document_source)")
+        
+        # Covering indexes for the summary views and the ArcGIS export
+        conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_grid_capacity_capacity_mw
+        ON grid_capacity(capacity_mw, project_name, location, document_source)
+        """)
+        conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_grid_connections_connection_type
+        ON grid_connections(connection_type, document_source)
+        """)
+        conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_investment_projects_timeline
+        ON investment_projects(timeline, currency, investment_amount)
+        """)
+        
+        # Refresh planner statistics so the covering indexes are picked up
+        conn.execute("ANALYZE")
 
     def create_views(self, conn: sqlite3.Connection):
         """Create database views for common queries"""
@@ -312,6 +644,26 @@ class GridIntelligenceDatabase:
         ORDER BY timeline
         """)
 
+    def refresh_summary_tables(self, conn: sqlite3.Connection):
+        """Rebuild the materialized summary tables, or drop them when disabled"""
+        for view in SUMMARY_VIEWS:
+            conn.execute(f"DROP TABLE IF EXISTS {view}_mv")
+            if self.materialize_views:
+                # Rows are stored in the view's ORDER BY order (rowid order)
+                conn.execute(f"CREATE TABLE {view}_mv AS SELECT * FROM {view}")
+        
+        if self.materialize_views:
+            logger.info(f"Refreshed {len(SUMMARY_VIEWS)} materialized summary tables")
+
+    def summary_query(self, conn: sqlite3.Connection, view: str) -> str:
+        """Query for a summary view, reading its materialized table when one exists"""
+        materialized = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (f"{view}_mv",)
+        ).fetchone()
+        if materialized:
+            return f"SELECT * FROM {view}_mv ORDER BY rowid"
+        return f"SELECT * FROM {view}"
+
     def extract_project_name(self, text: str) -> str:
         """Extract project name from text"""
         # Look for common project indicators
@@ -387,11 +739,11 @@ class GridIntelligenceDatabase:
             capacity_df.to_csv("data/grid_capacity_arcgis.csv", index=False)
             
             # Export connection summary
-            connection_df = pd.read_sql_query("SELECT * FROM connection_summary", conn)
+            connection_df = pd.read_sql_query(self.summary_query(conn, 'connection_summary'), conn)
             connection_df.to_csv("data/grid_connections_arcgis.csv", index=False)
             
             # Export investment timeline
-            investment_df = pd.read_sql_query("SELECT * FROM investment_timeline", conn)
+            investment_df = pd.read_sql_query(self.summary_query(conn, 'investment_timeline'), conn)
             investment_df.to_csv("data/grid_investments_arcgis.csv", index=False)
             
             logger.info("ArcGIS export files created in data/ directory")
@@ -456,10 +808,12 @@ class GridIntelligenceDatabase:
         logger.info("Dashboard configuration saved to data/arcgis_dashboard_config.json")
 
 if __name__ == "__main__":
-    db_creator = GridIntelligenceDatabase()
+    db_creator = GridIntelligenceDatabase(materialize_views=True)
     
-    # Create database
-    db_creator.create_database()
+    # Create or refresh database (only changed documents are reloaded)
+    load_stats = db_creator.create_database(incremental=True)
+    for table, stats in load_stats.items():
+        print(f"  {table}: {stats['rows']} rows ({stats['rows_per_sec']:,.0f} rows/sec)")
     
     # Export for ArcGIS
     db_creator.export_for_arcgis()
@@ -4,34 +4,410 @@ ENTSO-E Transparency Platform Client for European Grid Intelligence
 Pan-European transmission system data for datacenter site selection
 """
 
+import asyncio
 import requests
+import numpy as np
 import pandas as pd
 import json
 import os
+import re
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from functools import partial
+from typing import Dict, List, Optional, Any, Callable, Iterable, Iterator, Tuple
 import xml.etree.ElementTree as ET
 import logging
 
+from response_cache import ResponseCache
+from timeseries_store import TimeSeriesStore
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# ENTSO-E allows 400 requests per minute per user
+ENTSOE_REQUESTS_PER_MINUTE = 400
+
+# Longest time interval ENTSO-E accepts in a single request
+MAX_REQUEST_SPAN = timedelta(days=365)
+
+# Bytes read from the response stream per decoder feed
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+class TokenBucket:
+    """
+    Token bucket rate limiter shared by threads and asyncio tasks
+
+    Tokens refill at ``rate`` per second up to ``capacity``. Each request takes a
+    token; when the bucket is empty the caller reserves the next token and
+    waits until it has refilled, so concurrent callers queue up in order.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize token bucket
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def wait(self):
+        """Block until a token is available"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire(self):
+        """Wait without blocking the event loop until a token is available"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+# ISO 8601 durations used as ENTSO-E period resolutions (PT15M, PT60M, P1D, P7D, P1M, P1Y)
+RESOLUTION_PATTERN = re.compile(r'P(?:(\d+)Y)?(?:(\d+)M)?(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?)?$')
+
+# Period elements of publication and unavailability documents
+PERIOD_ELEMENTS = ('Period', 'Available_Period')
+
+# Columns identifying a series and the value columns of the client's frames
+SERIES_KEY_COLUMNS = ('from_country', 'to_country', 'from_domain', 'to_domain', 'curve_type')
+VALUE_COLUMNS = ('capacity_mw', 'flow_mw')
+RESAMPLE_AGGREGATIONS = ('mean', 'max', 'min')
+
+def resolution_minutes(resolution: str) -> Optional[int]:
+    """Length of a fixed-size resolution in minutes, or None for months/years"""
+    match = RESOLUTION_PATTERN.match(resolution)
+    if match is None or match.group(1) or match.group(2):
+        return None
+    weeks, days, hours, minutes = (int(value or 0) for value in match.groups()[2:])
+    return ((weeks * 7 + days) * 24 + hours) * 60 + minutes or None
+
+def resolution_months(resolution: str) -> Optional[int]:
+    """Length of a calendar resolution (P1M, P1Y) in months, or None"""
+    match = RESOLUTION_PATTERN.match(resolution)
+    if match is None or any(match.groups()[2:]):
+        return None
+    years, months = (int(value or 0) for value in match.groups()[:2])
+    return years * 12 + months or None
+
+def add_calendar_months(start: np.datetime64, months: np.ndarray) -> np.ndarray:
+    """
+    Add whole months to a timestamp, vectorized over ``months``
+
+    The time of day is kept and the day of month is clamped to the month's
+    length. A start on the last day of a month stays on month ends, which is how
+    local midnight at the start of a month appears in UTC for CET/EET zones.
+    """
+    start_day = start.astype('datetime64[D]')
+    start_month = start.astype('datetime64[M]')
+    time_of_day = start - start_day.astype('datetime64[s]')
+    day_of_month = (start_day - start_month.astype('datetime64[D]')).astype(np.int64)
+    on_month_end = start_day + 1 == (start_month + 1).astype('datetime64[D]')
+    
+    target_month = start_month + months
+    month_days = ((target_month + 1).astype('datetime64[D]') - target_month.astype('datetime64[D]')).astype(np.int64)
+    day = month_days - 1 if on_month_end else np.minimum(day_of_month, month_days - 1)
+    return target_month.astype('datetime64[D]') + day + time_of_day
+
+def period_timestamps(start: str, resolution: str, positions: np.ndarray) -> np.ndarray:
+    """UTC start of each point of a period, start + (position - 1) x resolution"""
+    if not start:
+        return np.full(len(positions), np.datetime64('NaT'), dtype='datetime64[s]')
+    
+    start = np.datetime64(start.rstrip('Z'), 's')
+    steps = positions - 1
+    minutes = resolution_minutes(resolution)
+    if minutes:
+        return start + steps * np.timedelta64(minutes * 60, 's')
+    months = resolution_months(resolution)
+    if months:
+        return add_calendar_months(start, steps * months).astype('datetime64[s]')
+    return np.full(len(positions), np.datetime64('NaT'), dtype='datetime64[s]')
+
+def utc_timestamps(values: np.ndarray) -> pd.DatetimeIndex:
+    """Wrap naive UTC datetime64 values as a timezone-aware DatetimeIndex"""
+    return pd.DatetimeIndex(values).tz_localize('UTC')
+
+def resample_to_grid(df: pd.DataFrame, freq: str = '60min', how: str = 'mean',
+                     value_column: Optional[str] = None, by: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Resample ENTSO-E series of mixed resolutions onto a common time grid
+    
+    Every point covers [timestamp, timestamp + resolution). Points coarser than
+    the grid are spread over all grid cells they cover and finer points are
+    aggregated into their cell, so 15-minute MTU countries can be compared with
+    hourly ones directly. Runs on arrays, without per-row Python.
+    
+    Args:
+        df: Frame from get_transmission_capacity, get_cross_border_flows or
+            get_transmission_capacity_history
+        freq: Grid cell size (pandas frequency, e.g. '15min', '60min', '1D')
+        how: Aggregation within a cell: 'mean', 'max' or 'min'
+        value_column: Column to aggregate (capacity_mw or flow_mw if not given)
+        by: Columns identifying a series (the client's key columns if not given)
+        
+    Returns:
+        Frame indexed by the UTC start of each grid cell, with the series key
+        columns and the aggregated value
+    """
+    if how not in RESAMPLE_AGGREGATIONS:
+        logger.error(f"Unsupported aggregation '{how}', use one of {RESAMPLE_AGGREGATIONS}")
+        return pd.DataFrame()
+    if df.empty or 'timestamp' not in df.columns:
+        return pd.DataFrame()
+    
+    if value_column is None:
+        value_column = next((column for column in VALUE_COLUMNS if column in df.columns), None)
+    if value_column is None:
+        logger.error("No value column to resample")
+        return pd.DataFrame()
+    by = list(by) if by is not None else [column for column in SERIES_KEY_COLUMNS if column in df.columns]
+    
+    df = df[df['timestamp'].notna()]
+    timestamps = df['timestamp']
+    if timestamps.dt.tz is not None:
+        timestamps = timestamps.dt.tz_convert('UTC').dt.tz_localize(None)
+    
+    # Number of grid cells each point covers (calendar resolutions count as one)
+    grid = pd.Timedelta(freq)
+    grid_minutes = grid // pd.Timedelta(minutes=1)
+    if 'resolution' in df.columns:
+        point_minutes = df['resolution'].map(
+            {resolution: resolution_minutes(resolution) or 0 for resolution in df['resolution'].unique()}
+        ).to_numpy(dtype=np.int64)
+        cells = np.maximum(point_minutes // max(grid_minutes, 1), 1)
+    else:
+        cells = np.ones(len(df), dtype=np.int64)
+    
+    rows = np.repeat(np.arange(len(df)), cells)
+    cell_offsets = np.arange(len(rows)) - np.repeat(np.cumsum(cells) - cells, cells)
+    first_cells = timestamps.dt.floor(freq).to_numpy()
+    
+    expanded = pd.DataFrame({column: df[column].to_numpy()[rows] for column in by})
+    expanded['timestamp'] = first_cells[rows] + cell_offsets * grid.to_timedelta64()
+    expanded[value_column] = df[value_column].to_numpy()[rows]
+    
+    result = expanded.groupby(by + ['timestamp'], sort=True)[value_column].agg(how).reset_index()
+    result.index = utc_timestamps(result.pop('timestamp').to_numpy())
+    result.index.name = 'timestamp'
+    return result.sort_index(kind='stable')
+
+class TimeSeriesDecoder:
+    """
+    Incremental decoder for ENTSO-E XML market documents
+
+    Bytes are fed as they arrive from the network. Points are read and cleared
+    as soon as they are complete, and every finished TimeSeries is returned as
+    columnar NumPy arrays and dropped from the tree, so neither the full
+    document nor a per-point dict list is ever held in memory.
+
+    Each decoded series is a dict with
+        document_type: Root element name (e.g. Publication_MarketDocument)
+        metadata: Text of the series' header elements, keyed by element name
+                  ('curveType') or parent/name ('MktPSRType/psrType')
+        timestamp: datetime64[s] UTC start of every point (see period_timestamps)
+        position, quantity: int64 / float64 point values
+        period_start, period_end, resolution: Per-point period attributes
+    """
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+        self._root = None
+        self.document_type = None
+        self.acknowledgement: Dict[str, str] = {}
+        self._positions = array('q')
+        self._quantities = array('d')
+        self._periods: List[Dict[str, Any]] = []
+        self._period_points = 0
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        """Feed the next chunk of the response; returns the series it completed"""
+        self._parser.feed(chunk)
+        return self._read_events()
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Finish decoding; raises ET.ParseError for a truncated document"""
+        self._parser.close()
+        return self._read_events()
+
+    def _set_root(self, root: ET.Element):
+        """Resolve the namespaced tags of the document"""
+        self._root = root
+        namespace = root.tag[:root.tag.rfind('}') + 1]
+        self._namespace = namespace
+        self.document_type = root.tag[len(namespace):]
+        self._tag = {name: namespace + name for name in (
+            'Point', 'position', 'quantity', 'TimeSeries', 'timeInterval', 'start', 'end',
+            'resolution', 'Reason', 'code', 'text'
+        )}
+        self._period_tags = {namespace + name for name in PERIOD_ELEMENTS}
+
+    def _read_events(self) -> List[Dict[str, Any]]:
+        completed = []
+        positions = self._positions
+        quantities = self._quantities
+        
+        for event, elem in self._parser.read_events():
+            if event == 'start':
+                if self._root is None:
+                    self._set_root(elem)
+                continue
+            
+            tag = self._tag
+            if elem.tag == tag['Point']:
+                # Hot path: one Point per time step
+                position = quantity = None
+                for child in elem:
+                    if child.tag == tag['position']:
+                        position = int(child.text)
+                    elif child.tag == tag['quantity']:
+                        quantity = float(child.text)
+                if position is not None and quantity is not None:
+                    positions.append(position)
+                    quantities.append(quantity)
+                    self._period_points += 1
+                elem.clear()
+            elif elem.tag in self._period_tags:
+                self._periods.append(self._read_period(elem))
+                elem.clear()
+            elif elem.tag == tag['TimeSeries']:
+                completed.append(self._finish_series(elem))
+                positions = self._positions
+                quantities = self._quantities
+                self._root.remove(elem)
+            elif elem.tag == tag['Reason']:
+                for child in elem:
+                    if child.tag in (tag['code'], tag['text']):
+                        self.acknowledgement[child.tag[len(self._namespace):]] = (child.text or '').strip()
+        
+        return completed
+
+    def _read_period(self, elem: ET.Element) -> Dict[str, Any]:
+        """Read the interval and resolution of a completed period"""
+        tag = self._tag
+        period = {'start': '', 'end': '', 'resolution': 'PT60M', 'points': self._period_points}
+        self._period_points = 0
+        
+        interval = elem.find(tag['timeInterval'])
+        if interval is not None:
+            for name in ('start', 'end'):
+                bound = interval.find(tag[name])
+                if bound is not None and bound.text:
+                    period[name] = bound.text.strip()
+        resolution = elem.find(tag['resolution'])
+        if resolution is not None and resolution.text:
+            period['resolution'] = resolution.text.strip()
+        return period
+
+    def _finish_series(self, elem: ET.Element) -> Dict[str, Any]:
+        """Convert a completed series to NumPy columns and reset the buffers"""
+        metadata = {}
+        for child in elem:
+            if child.tag in self._period_tags:
+                continue
+            name = child.tag[child.tag.rfind('}') + 1:]
+            if child.text and child.text.strip():
+                metadata.setdefault(name, child.text.strip())
+            for grandchild in child:
+                if grandchild.text and grandchild.text.strip():
+                    key = f"{name}/{grandchild.tag[grandchild.tag.rfind('}') + 1:]}"
+                    metadata.setdefault(key, grandchild.text.strip())
+        
+        position = np.array(self._positions, dtype=np.int64)
+        quantity = np.array(self._quantities, dtype=np.float64)
+        periods = self._periods
+        counts = [period['points'] for period in periods]
+        self._positions = array('q')
+        self._quantities = array('d')
+        self._periods = []
+        
+        timestamp = np.empty(len(position), dtype='datetime64[s]')
+        offset = 0
+        for period, count in zip(periods, counts):
+            timestamp[offset:offset + count] = period_timestamps(
+                period['start'], period['resolution'], position[offset:offset + count])
+            offset += count
+        
+        return {
+            'document_type': self.document_type,
+            'metadata': metadata,
+            'timestamp': timestamp,
+            'position': position,
+            'quantity': quantity,
+            'period_start': np.repeat(np.array([p['start'] for p in periods], dtype=object), counts),
+            'period_end': np.repeat(np.array([p['end'] for p in periods], dtype=object), counts),
+            'resolution': np.repeat(np.array([p['resolution'] for p in periods], dtype=object), counts)
+        }
+
+def iter_time_series(chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    """
+    Decode an ENTSO-E XML response stream into columnar time series
+
+    Acknowledgement documents (API errors, "no matching data") are logged and
+    yield nothing. See TimeSeriesDecoder for the layout of the series.
+    """
+    decoder = TimeSeriesDecoder()
+    received = False
+    for chunk in chunks:
+        if chunk:
+            received = True
+            yield from decoder.feed(chunk)
+    
+    if not received:
+        return
+    yield from decoder.close()
+    
+    if decoder.document_type == 'Acknowledgement_MarketDocument':
+        logger.error(f"ENTSO-E API error: {decoder.acknowledgement.get('code', '')} "
+                     f"{decoder.acknowledgement.get('text', '')}".rstrip())
+
 class ENTSOEClient:
     """
     Client for accessing ENTSO-E Transparency Platform data
     Pan-European transmission system data for grid intelligence
     """
     
-    def __init__(self, security_token: Optional[str] = None):
+    def __init__(self, security_token: Optional[str] = None, max_concurrency: int = 8,
+                 requests_per_minute: int = ENTSOE_REQUESTS_PER_MINUTE,
+                 response_cache: Optional[ResponseCache] = None,
+                 timeseries_store: Optional[TimeSeriesStore] = None):
         """
         Initialize ENTSO-E client
         
         Args:
             security_token: ENTSO-E API security token
+            max_concurrency: Maximum number of requests in flight in async mode
+            requests_per_minute: Request quota enforced for sync and async calls
+            response_cache: Optional persistent cache of API responses
+            timeseries_store: Optional store that fetched time series are upserted into
         """
         self.security_token = security_token or os.getenv('ENTSOE_SECURITY_TOKEN')
         self.base_url = "https://web-api.tp.entsoe.eu/api"
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = TokenBucket(requests_per_minute / 60.0, max_concurrency)
+        self._semaphore = None
+        self._semaphore_loop = None
+        self.response_cache = response_cache
+        self.timeseries_store = timeseries_store
         
         if not self.security_token:
             logger.warning("No ENTSO-E security token provided - API access will not work")
@@ -78,42 +454,183 @@ class ENTSOEClient:
         }
         
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_concurrency)
+        self.session.mount('https://', adapter)
 
-    def _make_request(self, params: Dict[str, str]) -> Optional[str]:
+    def _stream_request(self, params: Dict[str, str]) -> Iterator[bytes]:
         """
-        Make request to ENTSO-E API with error handling
+        Make request to ENTSO-E API with error handling, streaming the response
         
         Args:
             params: Query parameters for API request
             
         Returns:
-            XML response text or None if error
+            Iterator over chunks of the XML response body (empty if error)
         """
         if not self.security_token:
             logger.error("No security token available for ENTSO-E API")
-            return None
+            return
         
-        params['securityToken'] = self.security_token
+        window_end = datetime.strptime(params['periodEnd'], '%Y%m%d%H%M') if 'periodEnd' in params else None
+        params = dict(params, securityToken=self.security_token)
         
         try:
-            response = self.session.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
+            if self.response_cache is not None:
+                response = self.response_cache.get(self.session, self.base_url, params,
+                                                   window_end=window_end, timeout=30)
+            else:
+                response = self.session.get(self.base_url, params=params, timeout=30, stream=True)
             
-            # Check if response contains error
-            if 'Reason' in response.text and 'code' in response.text:
-                logger.error(f"ENTSO-E API error: {response.text}")
-                return None
+            with response:
+                response.raise_for_status()
+                yield from response.iter_content(chunk_size=RESPONSE_CHUNK_SIZE)
                 
-            return response.text
-            
         except requests.exceptions.RequestException as e:
             logger.error(f"Error making ENTSO-E request: {e}")
-            return None
+
+    def _decode_response(self, params: Dict[str, str],
+                         parse: Callable[[Iterator[Dict[str, Any]]], pd.DataFrame]) -> pd.DataFrame:
+        """Stream a response through the time series decoder into a parser"""
+        with closing(self._stream_request(params)) as chunks:
+            return parse(iter_time_series(chunks))
+
+    def _fetch(self, params: Dict[str, str],
+               parse: Callable[[Iterator[Dict[str, Any]]], pd.DataFrame]) -> pd.DataFrame:
+        """Make a rate-limited request and parse its response"""
+        # Stay within the ENTSO-E request quota; cached responses cost no request
+        if not self._is_cached(params):
+            self.rate_limiter.wait()
+        return self._decode_response(params, parse)
+
+    def _is_cached(self, params: Dict[str, str]) -> bool:
+        """Check whether a request can be answered from the response cache alone"""
+        return self.response_cache is not None and self.response_cache.is_fresh(self.base_url, params)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Concurrency limit for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _fetch_async(self, params: Dict[str, str],
+                           parse: Callable[[Iterator[Dict[str, Any]]], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Make a request and parse its response without blocking the event loop
+
+        At most ``max_concurrency`` requests are in flight and every request waits
+        for a token from the shared rate limiter before it is sent. The blocking
+        request and the XML decoding run in a worker thread. Cached responses
+        skip both limits.
+        """
+        if not self.security_token:
+            logger.error("No security token available for ENTSO-E API")
+            return parse(iter(()))
+        
+        if self._is_cached(params):
+            return await asyncio.to_thread(self._decode_response, params, parse)
+        
+        async with self._get_semaphore():
+            await self.rate_limiter.acquire()
+            return await asyncio.to_thread(self._decode_response, params, parse)
+
+    def _run(self, coroutine) -> Any:
+        """
+        Run a coroutine to completion from synchronous code
+
+        asyncio.run cannot be called while an event loop is running in this
+        thread (notebooks, async applications), so there the coroutine runs on a
+        private loop in a worker thread.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    def _split_period(self, start_date: datetime, end_date: datetime) -> List[Tuple[datetime, datetime]]:
+        """Split a time interval into consecutive windows the API accepts"""
+        windows = []
+        window_start = start_date
+        while window_start < end_date:
+            window_end = min(window_start + MAX_REQUEST_SPAN, end_date)
+            windows.append((window_start, window_end))
+            window_start = window_end
+        return windows or [(start_date, end_date)]
+
+    def _fetch_period(self, build_request: Callable, args: Tuple, start_date: datetime,
+                      end_date: datetime) -> pd.DataFrame:
+        """
+        Fetch a time interval, splitting it into concurrently fetched windows when
+        it is longer than the API allows
+        """
+        if len(self._split_period(start_date, end_date)) == 1:
+            return self._fetch(*build_request(*args, start_date, end_date))
+        return self._run(self._fetch_period_async(build_request, args, start_date, end_date))
+
+    async def _fetch_period_async(self, build_request: Callable, args: Tuple, start_date: datetime,
+                                  end_date: datetime) -> pd.DataFrame:
+        """Async variant of _fetch_period"""
+        windows = self._split_period(start_date, end_date)
+        frames = await asyncio.gather(*(
+            self._fetch_async(*build_request(*args, window_start, window_end))
+            for window_start, window_end in windows
+        ))
+        if len(frames) == 1:
+            return frames[0]
+        
+        df = self._stitch_windows(frames)
+        logger.info(f"Stitched {len(windows)} request windows into {len(df)} records")
+        return df
+
+    def _stitch_windows(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Combine consecutive window frames into one frame
+
+        Points returned by both neighbouring windows are kept once, and rows are
+        ordered by timestamp (stable, so series order within a time step is kept).
+        """
+        df = self._concat_series_frames(frames)
+        if df.empty:
+            return df
+        
+        if 'timestamp' in df.columns and df['timestamp'].notna().all():
+            # Timestamps identify the points; period start/position may differ per window
+            df = df.drop_duplicates(subset=[c for c in df.columns if c not in ('start_time', 'position')])
+            df = df.sort_values('timestamp', kind='stable')
+        else:
+            df = df.drop_duplicates()
+        return df.reset_index(drop=True)
+
+    def _period_params(self, start_date: datetime, end_date: datetime) -> Dict[str, str]:
+        """Query parameters for a time interval"""
+        return {
+            'periodStart': start_date.strftime('%Y%m%d%H%M'),
+            'periodEnd': end_date.strftime('%Y%m%d%H%M')
+        }
+
+    def _transmission_capacity_request(self, country_from: str, country_to: str,
+                                       start_date: datetime, end_date: datetime) -> Tuple[Dict[str, str], Callable]:
+        """Build the query parameters and response parser for transmission capacity"""
+        from_code = self.country_codes.get(country_from, country_from)
+        to_code = self.country_codes.get(country_to, country_to)
+        
+        params = {
+            'documentType': self.document_types['transmission_capacity'],
+            'in_Domain': from_code,
+            'out_Domain': to_code,
+            **self._period_params(start_date, end_date)
+        }
+        return params, partial(self._parse_transmission_capacity, country_from=country_from,
+                               country_to=country_to, from_code=from_code, to_code=to_code)
 
     def get_transmission_capacity(self, country_from: str, country_to: str, 
                                 start_date: datetime, end_date: datetime) -> pd.DataFrame:
         """
         Get transmission capacity between two countries/bidding zones
+        Ranges longer than the API limit are fetched as concurrent windows
         
         Args:
             country_from: Source country/bidding zone
@@ -124,53 +641,35 @@ class ENTSOEClient:
         Returns:
             DataFrame with transmission capacity data
         """
-        from_code = self.country_codes.get(country_from, country_from)
-        to_code = self.country_codes.get(country_to, country_to)
-        
-        params = {
-            'documentType': self.document_types['transmission_capacity'],
-            'in_Domain': from_code,
-            'out_Domain': to_code,
-            'periodStart': start_date.strftime('%Y%m%d%H%M'),
-            'periodEnd': end_date.strftime('%Y%m%d%H%M')
-        }
-        
-        response_xml = self._make_request(params)
-        if not response_xml:
-            return pd.DataFrame()
-        
+        return self._fetch_period(self._transmission_capacity_request, (country_from, country_to),
+                                  start_date, end_date)
+
+    async def get_transmission_capacity_async(self, country_from: str, country_to: str,
+                                              start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """Async variant of get_transmission_capacity"""
+        return await self._fetch_period_async(self._transmission_capacity_request, (country_from, country_to),
+                                              start_date, end_date)
+
+    def _parse_transmission_capacity(self, series: Iterator[Dict[str, Any]], country_from: str, country_to: str,
+                                     from_code: str, to_code: str) -> pd.DataFrame:
+        """Build the transmission capacity frame from decoded time series"""
         try:
-            # Parse XML response
-            root = ET.fromstring(response_xml)
+            frames = []
+            for time_series in series:
+                metadata = time_series['metadata']
+                frames.append(pd.DataFrame({
+                    'from_domain': metadata.get('in_Domain.mRID', from_code),
+                    'to_domain': metadata.get('out_Domain.mRID', to_code),
+                    'curve_type': metadata.get('curveType', 'Unknown'),
+                    'start_time': time_series['period_start'],
+                    'resolution': time_series['resolution'],
+                    'position': time_series['position'],
+                    'capacity_mw': time_series['quantity'],
+                    'timestamp': utc_timestamps(time_series['timestamp'])
+                }))
             
-            capacity_data = []
-            for time_series in root.findall('.//{*}TimeSeries'):
-                # Extract metadata
-                in_domain = time_series.find('.//{*}in_Domain.mRID')
-                out_domain = time_series.find('.//{*}out_Domain.mRID')
-                curve_type = time_series.find('.//{*}curveType')
-                
-                # Extract time period data
-                for period in time_series.findall('.//{*}Period'):
-                    start_time = period.find('.//{*}timeInterval/{*}start')
-                    resolution = period.find('.//{*}resolution')
-                    
-                    for point in period.findall('.//{*}Point'):
-                        position = point.find('.//{*}position')
-                        quantity = point.find('.//{*}quantity')
-                        
-                        if all(x is not None for x in [start_time, position, quantity]):
-                            capacity_data.append({
-                                'from_domain': in_domain.text if in_domain is not None else from_code,
-                                'to_domain': out_domain.text if out_domain is not None else to_code,
-                                'curve_type': curve_type.text if curve_type is not None else 'Unknown',
-                                'start_time': start_time.text,
-                                'resolution': resolution.text if resolution is not None else 'PT60M',
-                                'position': int(position.text),
-                                'capacity_mw': float(quantity.text)
-                            })
-            
-            df = pd.DataFrame(capacity_data)
+            df = self._concat_series_frames(frames)
+            self._archive('capacity', df, f"{country_from}-{country_to}")
             logger.info(f"Retrieved {len(df)} transmission capacity records for {country_from} -> {country_to}")
             return df
             
@@ -181,10 +680,22 @@ class ENTSOEClient:
             logger.error(f"Error processing transmission capacity data: {e}")
             return pd.DataFrame()
 
+    def _cross_border_flows_request(self, country_from: str, country_to: str,
+                                    start_date: datetime, end_date: datetime) -> Tuple[Dict[str, str], Callable]:
+        """Build the query parameters and response parser for cross-border flows"""
+        params = {
+            'documentType': self.document_types['cross_border_flows'],
+            'in_Domain': self.country_codes.get(country_from, country_from),
+            'out_Domain': self.country_codes.get(country_to, country_to),
+            **self._period_params(start_date, end_date)
+        }
+        return params, partial(self._parse_cross_border_flows, country_from=country_from, country_to=country_to)
+
     def get_cross_border_flows(self, country_from: str, country_to: str,
                              start_date: datetime, end_date: datetime) -> pd.DataFrame:
         """
         Get actual cross-border electricity flows
+        Ranges longer than the API limit are fetched as concurrent windows
         
         Args:
             country_from: Source country
@@ -195,45 +706,34 @@ class ENTSOEClient:
         Returns:
             DataFrame with actual flow data
         """
-        from_code = self.country_codes.get(country_from, country_from)
-        to_code = self.country_codes.get(country_to, country_to)
-        
-        params = {
-            'documentType': self.document_types['cross_border_flows'],
-            'in_Domain': from_code,
-            'out_Domain': to_code,
-            'periodStart': start_date.strftime('%Y%m%d%H%M'),
-            'periodEnd': end_date.strftime('%Y%m%d%H%M')
-        }
-        
-        response_xml = self._make_request(params)
-        if not response_xml:
-            return pd.DataFrame()
-        
+        return self._fetch_period(self._cross_border_flows_request, (country_from, country_to),
+                                  start_date, end_date)
+
+    async def get_cross_border_flows_async(self, country_from: str, country_to: str,
+                                           start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """Async variant of get_cross_border_flows"""
+        return await self._fetch_period_async(self._cross_border_flows_request, (country_from, country_to),
+                                              start_date, end_date)
+
+    def _parse_cross_border_flows(self, series: Iterator[Dict[str, Any]], country_from: str,
+                                  country_to: str) -> pd.DataFrame:
+        """Build the cross-border flow frame from decoded time series"""
         try:
-            root = ET.fromstring(response_xml)
-            flow_data = []
-            
-            for time_series in root.findall('.//{*}TimeSeries'):
-                for period in time_series.findall('.//{*}Period'):
-                    start_time = period.find('.//{*}timeInterval/{*}start')
-                    resolution = period.find('.//{*}resolution')
-                    
-                    for point in period.findall('.//{*}Point'):
-                        position = point.find('.//{*}position')
-                        quantity = point.find('.//{*}quantity')
-                        
-                        if all(x is not None for x in [start_time, position, quantity]):
-                            flow_data.append({
-                                'from_country': country_from,
-                                'to_country': country_to,
-                                'start_time': start_time.text,
-                                'resolution': resolution.text if resolution is not None else 'PT60M',
-                                'position': int(position.text),
-                                'flow_mw': float(quantity.text)
-                            })
+            frames = [
+                pd.DataFrame({
+                    'from_country': country_from,
+                    'to_country': country_to,
+                    'start_time': time_series['period_start'],
+                    'resolution': time_series['resolution'],
+                    'position': time_series['position'],
+                    'flow_mw': time_series['quantity'],
+                    'timestamp': utc_timestamps(time_series['timestamp'])
+                })
+                for time_series in series
+            ]
             
-            df = pd.DataFrame(flow_data)
+            df = self._concat_series_frames(frames)
+            self._archive('flows', df, f"{country_from}-{country_to}")
             logger.info(f"Retrieved {len(df)} flow records for {country_from} -> {country_to}")
             return df
             
@@ -241,6 +741,20 @@ class ENTSOEClient:
             logger.error(f"Error processing cross-border flow data: {e}")
             return pd.DataFrame()
 
+    def _installed_capacity_request(self, country: str, year: int) -> Tuple[Dict[str, str], Callable]:
+        """Build the query parameters and response parser for installed capacity"""
+        # Use January 1st for the year
+        start_date = datetime(year, 1, 1)
+        end_date = datetime(year, 12, 31)
+        
+        params = {
+            'documentType': self.document_types['installed_capacity'],
+            'processType': 'A33',  # Installed capacity per production type
+            'in_Domain': self.country_codes.get(country, country),
+            **self._period_params(start_date, end_date)
+        }
+        return params, partial(self._parse_installed_capacity, country=country, year=year)
+
     def get_installed_capacity_by_fuel(self, country: str, year: int) -> pd.DataFrame:
         """
         Get installed generation capacity by fuel type
@@ -253,45 +767,28 @@ class ENTSOEClient:
         Returns:
             DataFrame with capacity by fuel type
         """
-        country_code = self.country_codes.get(country, country)
-        
-        # Use January 1st for the year
-        start_date = datetime(year, 1, 1)
-        end_date = datetime(year, 12, 31)
-        
-        params = {
-            'documentType': self.document_types['installed_capacity'],
-            'processType': 'A33',  # Installed capacity per production type
-            'in_Domain': country_code,
-            'periodStart': start_date.strftime('%Y%m%d%H%M'),
-            'periodEnd': end_date.strftime('%Y%m%d%H%M')
-        }
-        
-        response_xml = self._make_request(params)
-        if not response_xml:
-            return pd.DataFrame()
-        
+        return self._fetch(*self._installed_capacity_request(country, year))
+
+    async def get_installed_capacity_by_fuel_async(self, country: str, year: int) -> pd.DataFrame:
+        """Async variant of get_installed_capacity_by_fuel"""
+        return await self._fetch_async(*self._installed_capacity_request(country, year))
+
+    def _parse_installed_capacity(self, series: Iterator[Dict[str, Any]], country: str,
+                                  year: int) -> pd.DataFrame:
+        """Build the installed capacity frame from decoded time series"""
         try:
-            root = ET.fromstring(response_xml)
-            capacity_data = []
-            
-            for time_series in root.findall('.//{*}TimeSeries'):
-                # Get fuel type
-                production_type = time_series.find('.//{*}MktPSRType/{*}psrType')
-                fuel_type = production_type.text if production_type is not None else 'Unknown'
-                
-                for period in time_series.findall('.//{*}Period'):
-                    for point in period.findall('.//{*}Point'):
-                        quantity = point.find('.//{*}quantity')
-                        if quantity is not None:
-                            capacity_data.append({
-                                'country': country,
-                                'fuel_type': fuel_type,
-                                'capacity_mw': float(quantity.text),
-                                'year': year
-                            })
+            frames = [
+                pd.DataFrame({
+                    'country': country,
+                    'fuel_type': time_series['metadata'].get('MktPSRType/psrType', 'Unknown'),
+                    'capacity_mw': time_series['quantity'],
+                    'year': year
+                })
+                for time_series in series
+            ]
             
-            df = pd.DataFrame(capacity_data)
+            df = self._concat_series_frames(frames)
+            self._archive('installed_capacity', df, country)
             logger.info(f"Retrieved installed capacity data for {country} ({len(df)} records)")
             return df
             
@@ -299,10 +796,21 @@ class ENTSOEClient:
             logger.error(f"Error processing installed capacity data: {e}")
             return pd.DataFrame()
 
+    def _unavailable_capacity_request(self, country: str, start_date: datetime,
+                                      end_date: datetime) -> Tuple[Dict[str, str], Callable]:
+        """Build the query parameters and response parser for unavailable capacity"""
+        params = {
+            'documentType': self.document_types['unavailable_capacity'],
+            'biddingZone_Domain': self.country_codes.get(country, country),
+            **self._period_params(start_date, end_date)
+        }
+        return params, partial(self._parse_unavailable_capacity, country=country)
+
     def get_unavailable_capacity(self, country: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
         """
         Get unavailable transmission capacity (outages, maintenance)
         Critical for understanding grid constraints and queue impacts
+        Ranges longer than the API limit are fetched as concurrent windows
         
         Args:
             country: Country name or code
@@ -312,47 +820,32 @@ class ENTSOEClient:
         Returns:
             DataFrame with unavailable capacity data
         """
-        country_code = self.country_codes.get(country, country)
-        
-        params = {
-            'documentType': self.document_types['unavailable_capacity'],
-            'biddingZone_Domain': country_code,
-            'periodStart': start_date.strftime('%Y%m%d%H%M'),
-            'periodEnd': end_date.strftime('%Y%m%d%H%M')
-        }
-        
-        response_xml = self._make_request(params)
-        if not response_xml:
-            return pd.DataFrame()
-        
+        return self._fetch_period(self._unavailable_capacity_request, (country,), start_date, end_date)
+
+    async def get_unavailable_capacity_async(self, country: str, start_date: datetime,
+                                             end_date: datetime) -> pd.DataFrame:
+        """Async variant of get_unavailable_capacity"""
+        return await self._fetch_period_async(self._unavailable_capacity_request, (country,), start_date, end_date)
+
+    def _parse_unavailable_capacity(self, series: Iterator[Dict[str, Any]], country: str) -> pd.DataFrame:
+        """Build the unavailable capacity frame from decoded time series"""
         try:
-            root = ET.fromstring(response_xml)
-            unavailable_data = []
-            
-            for unavailability in root.findall('.//{*}Unavailability_MarketDocument'):
-                for time_series in unavailability.findall('.//{*}TimeSeries'):
-                    # Extract asset information
-                    asset_name = time_series.find('.//{*}registeredResource/{*}name')
-                    asset_type = time_series.find('.//{*}registeredResource/{*}asset_type')
-                    
-                    for period in time_series.findall('.//{*}Period'):
-                        start_time = period.find('.//{*}timeInterval/{*}start')
-                        end_time = period.find('.//{*}timeInterval/{*}end')
-                        
-                        for point in period.findall('.//{*}Point'):
-                            quantity = point.find('.//{*}quantity')
-                            
-                            if quantity is not None:
-                                unavailable_data.append({
-                                    'country': country,
-                                    'asset_name': asset_name.text if asset_name is not None else 'Unknown',
-                                    'asset_type': asset_type.text if asset_type is not None else 'Unknown',
-                                    'start_time': start_time.text if start_time is not None else '',
-                                    'end_time': end_time.text if end_time is not None else '',
-                                    'unavailable_capacity_mw': float(quantity.text)
-                                })
+            frames = []
+            for time_series in series:
+                if time_series['document_type'] != 'Unavailability_MarketDocument':
+                    continue
+                metadata = time_series['metadata']
+                frames.append(pd.DataFrame({
+                    'country': country,
+                    'asset_name': metadata.get('registeredResource/name', 'Unknown'),
+                    'asset_type': metadata.get('registeredResource/asset_type', 'Unknown'),
+                    'start_time': time_series['period_start'],
+                    'end_time': time_series['period_end'],
+                    'unavailable_capacity_mw': time_series['quantity']
+                }))
             
-            df = pd.DataFrame(unavailable_data)
+            df = self._concat_series_frames(frames)
+            self._archive('unavailability', df, country)
             logger.info(f"Retrieved {len(df)} unavailable capacity records for {country}")
             return df
             
@@ -360,11 +853,73 @@ class ENTSOEClient:
             logger.error(f"Error processing unavailable capacity data: {e}")
             return pd.DataFrame()
 
+    def _archive(self, table: str, df: pd.DataFrame, zone: str):
+        """Upsert a fetched frame into the time series store, if one is configured"""
+        if self.timeseries_store is None or df.empty:
+            return
+        
+        try:
+            self.timeseries_store.write(table, df, zone)
+        except Exception as e:
+            logger.error(f"Error storing {table} records for {zone}: {e}")
+
+    def _concat_series_frames(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """Concatenate per-series frames (an empty frame when there is no data)"""
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def get_transmission_capacity_history(self, countries: List[str], start_date: datetime,
+                                          end_date: datetime) -> pd.DataFrame:
+        """
+        Get transmission capacity in both directions of every border between countries
+        
+        All borders and request windows are fetched concurrently, so multi-year
+        history for all borders comes back in a single call.
+        
+        Args:
+            countries: Countries/bidding zones whose mutual borders to fetch
+            start_date: Start date (may be several years back)
+            end_date: End date
+            
+        Returns:
+            DataFrame with transmission capacity data and from_country/to_country columns
+        """
+        return self._run(self.get_transmission_capacity_history_async(countries, start_date, end_date))
+
+    async def get_transmission_capacity_history_async(self, countries: List[str], start_date: datetime,
+                                                      end_date: datetime) -> pd.DataFrame:
+        """Async variant of get_transmission_capacity_history"""
+        directions = [
+            (country_from, country_to)
+            for i, country1 in enumerate(countries)
+            for country2 in countries[i+1:]
+            for country_from, country_to in ((country1, country2), (country2, country1))
+        ]
+        frames = await asyncio.gather(*(
+            self.get_transmission_capacity_async(country_from, country_to, start_date, end_date)
+            for country_from, country_to in directions
+        ))
+        
+        for (country_from, country_to), df in zip(directions, frames):
+            if not df.empty:
+                df.insert(0, 'from_country', country_from)
+                df.insert(1, 'to_country', country_to)
+        
+        df = self._concat_series_frames(frames)
+        logger.info(f"Retrieved {len(df)} transmission capacity records for {len(directions) // 2} borders")
+        return df
+
     def analyze_grid_constraints_for_datacenter(self, target_countries: List[str], 
                                               analysis_months: int = 12) -> Dict[str, Any]:
         """
         Comprehensive grid constraint analysis for datacenter site selection
         
+        All requests of the analysis are issued concurrently; see
+        analyze_grid_constraints_for_datacenter_async() for use inside a running
+        event loop.
+        
         Args:
             target_countries: List of countries to analyze
             analysis_months: Number of months of historical data to analyze
@@ -372,7 +927,19 @@ class ENTSOEClient:
         Returns:
             Dictionary with comprehensive grid analysis
         """
-        end_date = datetime.now()
+        return self._run(self.analyze_grid_constraints_for_datacenter_async(target_countries, analysis_months))
+
+    async def analyze_grid_constraints_for_datacenter_async(self, target_countries: List[str],
+                                                            analysis_months: int = 12) -> Dict[str, Any]:
+        """
+        Async variant of analyze_grid_constraints_for_datacenter
+
+        The per-country and per-border requests are gathered at once, so the
+        analysis takes about as long as its slowest request (within the
+        concurrency and rate limits).
+        """
+        # Whole hours keep request windows (and so cache keys) stable between runs
+        end_date = datetime.now().replace(minute=0, second=0, microsecond=0)
         start_date = end_date - timedelta(days=30 * analysis_months)
         
         analysis_results = {
@@ -388,8 +955,34 @@ class ENTSOEClient:
         
         logger.info(f"Starting grid constraint analysis for {len(target_countries)} countries")
         
+        # Installed capacity (latest year) and unavailable capacity (last 3 months) per country
+        current_year = datetime.now().year
+        unavail_start = end_date - timedelta(days=90)
+        country_requests = [
+            (self.get_installed_capacity_by_fuel_async(country, current_year),
+             self.get_unavailable_capacity_async(country, unavail_start, end_date))
+            for country in target_countries
+        ]
+        
+        # Capacity in both directions between target countries
+        country_pairs = [
+            (country1, country2)
+            for i, country1 in enumerate(target_countries)
+            for country2 in target_countries[i+1:]
+        ]
+        border_requests = [
+            (self.get_transmission_capacity_async(country1, country2, start_date, end_date),
+             self.get_transmission_capacity_async(country2, country1, start_date, end_date))
+            for country1, country2 in country_pairs
+        ]
+        
+        results = await asyncio.gather(*(request for pair in country_requests + border_requests
+                                         for request in pair))
+        country_results = results[:2 * len(target_countries)]
+        border_results = results[2 * len(target_countries):]
+        
         # Analyze each country
-        for country in target_countries:
+        for index, country in enumerate(target_countries):
             logger.info(f"Analyzing grid constraints for {country}")
             
             country_analysis = {
@@ -399,18 +992,13 @@ class ENTSOEClient:
                 'constraint_score': 0  # Will calculate based on data
             }
             
-            # Get installed capacity (latest year)
-            current_year = datetime.now().year
-            capacity_df = self.get_installed_capacity_by_fuel(country, current_year)
+            capacity_df, unavail_df = country_results[2 * index:2 * index + 2]
             if not capacity_df.empty:
                 country_analysis['installed_capacity'] = {
                     'total_mw': capacity_df['capacity_mw'].sum(),
                     'by_fuel_type': capacity_df.groupby('fuel_type')['capacity_mw'].sum().to_dict()
                 }
             
-            # Get unavailable capacity (last 3 months)
-            unavail_start = end_date - timedelta(days=90)
-            unavail_df = self.get_unavailable_capacity(country, unavail_start, end_date)
             if not unavail_df.empty:
                 country_analysis['unavailable_capacity'] = {
                     'avg_unavailable_mw': unavail_df['unavailable_capacity_mw'].mean(),
@@ -421,27 +1009,24 @@ class ENTSOEClient:
             analysis_results['countries'][country] = country_analysis
         
         # Cross-border analysis between target countries
-        for i, country1 in enumerate(target_countries):
-            for country2 in target_countries[i+1:]:
-                logger.info(f"Analyzing cross-border capacity: {country1} <-> {country2}")
-                
-                # Get capacity in both directions
-                cap_12 = self.get_transmission_capacity(country1, country2, start_date, end_date)
-                cap_21 = self.get_transmission_capacity(country2, country1, start_date, end_date)
-                
-                cross_border_key = f"{country1}-{country2}"
-                analysis_results['cross_border_analysis'][cross_border_key] = {
-                    f'{country1}_to_{country2}': {
-                        'avg_capacity_mw': cap_12['capacity_mw'].mean() if not cap_12.empty else 0,
-                        'max_capacity_mw': cap_12['capacity_mw'].max() if not cap_12.empty else 0,
-                        'records_count': len(cap_12)
-                    },
-                    f'{country2}_to_{country1}': {
-                        'avg_capacity_mw': cap_21['capacity_mw'].mean() if not cap_21.empty else 0,
-                        'max_capacity_mw': cap_21['capacity_mw'].max() if not cap_21.empty else 0,
-                        'records_count': len(cap_21)
-                    }
+        for index, (country1, country2) in enumerate(country_pairs):
+            logger.info(f"Analyzing cross-border capacity: {country1} <-> {country2}")
+            
+            cap_12, cap_21 = border_results[2 * index:2 * index + 2]
+            
+            cross_border_key = f"{country1}-{country2}"
+            analysis_results['cross_border_analysis'][cross_border_key] = {
+                f'{country1}_to_{country2}': {
+                    'avg_capacity_mw': cap_12['capacity_mw'].mean() if not cap_12.empty else 0,
+                    'max_capacity_mw': cap_12['capacity_mw'].max() if not cap_12.empty else 0,
+                    'records_count': len(cap_12)
+                },
+                f'{country2}_to_{country1}': {
+                    'avg_capacity_mw': cap_21['capacity_mw'].mean() if not cap_21.empty else 0,
+                    'max_capacity_mw': cap_21['capacity_mw'].max() if not cap_21.empty else 0,
+                    'records_count': len(cap_21)
                 }
+            }
         
         # Calculate constraint summary
         analysis_results['grid_constraints_summary'] = {
@@ -509,7 +1094,7 @@ def main():
     target_countries = ['Finland', 'Sweden', 'Norway', 'Denmark', 'Germany', 'Netherlands']
     
     # Initialize client
-    client = ENTSOEClient()
+    client = ENTSOEClient(response_cache=ResponseCache(), timeseries_store=TimeSeriesStore())
     
     if not client.security_token:
         print("ERROR: ENTSO-E Security Token required")
@@ -13,6 +13,9 @@ from typing import Dict, List, Optional, Any
 import time
 import logging
 
+from response_cache import ResponseCache
+from timeseries_store import TimeSeriesStore
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -22,16 +25,21 @@ class FingridAPIClient:
     Client for accessing Fingrid (Finnish TSO) data for grid queue intelligence
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, response_cache: Optional[ResponseCache] = None,
+                 timeseries_store: Optional[TimeSeriesStore] = None):
         """
         Initialize Fingrid API client
         
         Args:
             api_key: Fingrid API key (will try environment variable if not provided)
+            response_cache: Optional persistent cache of API responses
+            timeseries_store: Optional store that fetched capacity series are upserted into
         """
         self.api_key = api_key or os.getenv('FINGRID_API_KEY')
         self.base_url = "https://api.fingrid.fi/v1"
         self.data_url = "https://data.fingrid.fi/api/datasets"
+        self.response_cache = response_cache
+        self.timeseries_store = timeseries_store
         
         if not self.api_key:
             logger.warning("No Fingrid API key provided - some endpoints may not work")
@@ -56,6 +64,44 @@ class FingridAPIClient:
                 'Accept': 'application/json'
             })
 
+    def _get(self, url: str, params: Optional[Dict[str, str]] = None,
+             window_end: Optional[datetime] = None):
+        """
+        GET a URL, through the response cache when one is configured
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            window_end: End of the data window the request covers, if any
+            
+        Returns:
+            Response object
+        """
+        if self.response_cache is not None:
+            return self.response_cache.get(self.session, url, params, window_end=window_end)
+        return self.session.get(url, params=params)
+
+    def _archive_capacity(self, df: pd.DataFrame, variable_id: str):
+        """
+        Upsert a fetched capacity series into the time series store, if one is configured
+        
+        Args:
+            df: Events as returned by the variable events endpoint
+            variable_id: Fingrid variable ID (stored as zone 'fingrid-<id>')
+        """
+        if self.timeseries_store is None or df.empty or 'start_time' not in df.columns:
+            return
+        
+        try:
+            records = pd.DataFrame({
+                'timestamp': pd.to_datetime(df['start_time'], utc=True),
+                'capacity_mw': pd.to_numeric(df['value'], errors='coerce').astype(float),
+                'variable_id': variable_id
+            })
+            self.timeseries_store.write('capacity', records, f"fingrid-{variable_id}")
+        except Exception as e:
+            logger.error(f"Error storing Fingrid variable {variable_id}: {e}")
+
     def get_transmission_capacity_data(self, start_time: datetime, end_time: datetime) -> pd.DataFrame:
         """
         Get transmission capacity data - critical for understanding grid limitations
@@ -79,11 +125,12 @@ class FingridAPIClient:
             
             url = f"{self.base_url}/variable/{dataset_id}/events/json"
             
-            response = self.session.get(url, params=params)
+            response = self._get(url, params=params, window_end=end_time)
             response.raise_for_status()
             
             data = response.json()
             df = pd.DataFrame(data)
+            self._archive_capacity(df, dataset_id)
             
             logger.info(f"Retrieved {len(df)} transmission capacity records")
             return df
@@ -124,9 +171,10 @@ class FingridAPIClient:
                 
                 url = f"{self.base_url}/variable/{var_id}/events/json"
                 
-                response = self.session.get(url, params=params)
+                response = self._get(url, params=params, window_end=end_time)
                 if response.status_code == 200:
                     data = response.json()
+                    self._archive_capacity(pd.DataFrame(data), var_id)
                     for item in data:
                         item['variable_id'] = var_id
                     all_data.extend(data)
@@ -150,7 +198,7 @@ class FingridAPIClient:
             List of available datasets with metadata
         """
         try:
-            response = self.session.get(f"{self.data_url}")
+            response = self._get(f"{self.data_url}")
             response.raise_for_status()
             
             datasets = response.json()
@@ -245,7 +293,7 @@ class FingridAPIClient:
             for endpoint in planning_endpoints:
                 try:
                     url = f"{self.base_url}{endpoint}"
-                    response = self.session.get(url)
+                    response = self._get(url)
                     
                     if response.status_code == 200:
                         plan_data['api_endpoints'].append({
@@ -307,7 +355,8 @@ class FingridAPIClient:
         
         # Get recent transmission data (last 30 days)
         try:
-            end_time = datetime.now()
+            # Whole hours keep the request parameters (and so cache keys) stable between runs
+            end_time = datetime.now().replace(minute=0, second=0, microsecond=0)
             start_time = end_time - timedelta(days=30)
             
             transmission_df = self.get_transmission_capacity_data(start_time, end_time)
@@ -364,7 +413,7 @@ def main():
     logger.info("Starting Fingrid Grid Intelligence Collection")
     
     # Initialize client (will use environment variable for API key if available)
-    client = FingridAPIClient()
+    client = FingridAPIClient(response_cache=ResponseCache(), timeseries_store=TimeSeriesStore())
     
     # Export all available data
     exported = client.export_grid_intelligence_data()
@@ -5,17 +5,410 @@ Extracts grid capacity, connection queue, and infrastructure data from collected
 """
 
 import pdfplumber
+import numpy as np
 import pandas as pd
+import hashlib
 import json
+import os
 import re
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
 import logging
 
+from page_text_cache import PageTextCache
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Sentence categories, in the order their records are stored
+SENTENCE_CATEGORIES = ('capacity', 'connection', 'constraint', 'investment')
+CAPACITY_MASK, CONNECTION_MASK, CONSTRAINT_MASK, INVESTMENT_MASK = (1 << bit for bit in range(4))
+
+# Sentence segmentation: a sentence ends at '.', '!' or '?' followed by whitespace
+# or the end of the page, unless the period closes a listed abbreviation or a run
+# of dotted letters ("U.S."); decimals ("1.5 GW") and dates ("1.1.2025") therefore
+# never split, while a lone capital ("Plan B.") still ends its sentence
+SENTENCE_ABBREVIATIONS = (
+    'e.g', 'i.e', 'etc', 'vs', 'approx', 'incl', 'excl', 'no', 'nr', 'fig', 'tab', 'ca', 'cf',
+    'esim', 'mm', 'ym', 'jne', 'ks', 'noin', 'milj', 'mrd', 'bl.a', 't.ex', 'resp', 'kl',
+    'st', 'mr', 'dr', 'prof', 'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept',
+    'oct', 'nov', 'dec'
+)
+# One fixed-width lookbehind per abbreviation length, tested only right after a terminator
+SENTENCE_END_PATTERN = re.compile(
+    r'[.!?](?=[.!?]*(?:\s|\Z))'
+    + ''.join(
+        '(?<!\\b(?:' + '|'.join(re.escape(abbreviation) for abbreviation in SENTENCE_ABBREVIATIONS
+                            if len(abbreviation) == length) + ')\\.)'
+        for length in sorted({len(abbreviation) for abbreviation in SENTENCE_ABBREVIATIONS})
+    )
+    + r'(?<![^\W\d_]\.[^\W\d_]\.)[.!?]*\s*',
+    re.IGNORECASE
+)
+CAPACITY_VALUE_PATTERN = re.compile(r'(\d+(?:,\d{3})*(?:\.\d+)?)\s*(MW|GW|MVA)', re.IGNORECASE)
+YEAR_PATTERN = re.compile(r'20\d{2}')
+COST_PATTERN = re.compile(r'(\d+(?:,\d{3})*(?:\.\d+)?)\s*(million|billion|M€|B€)', re.IGNORECASE)
+
+# Every number on a page with its optional unit, in one pass; the named group
+# that matched is the category, and unitless 20xx numbers are years
+NUMERIC_VALUE_PATTERN = re.compile(r'''
+    (?<![\w.,])(?P<number>\d+(?:,\d{3})*(?:\.\d+)?)
+    (?:\s*(?:
+        (?P<electrical>GWh|MWh|TWh|GW|MW|MVA|kV|MV|GV)
+      | (?P<cost>M€|B€|million|billion|€)
+      | (?P<distance>km|meters?|m)
+    )(?!\w))?
+''', re.IGNORECASE | re.VERBOSE)
+NUMERIC_UNIT_GROUPS = ('electrical', 'cost', 'distance')
+YEAR_NUMBER_PATTERN = re.compile(r'20\d{2}')
+
+# Unit (lowercase) -> (normalized unit, scale factor)
+UNIT_NORMALIZATION = {
+    'mw': ('MW', 1.0),
+    'gw': ('MW', 1000.0),
+    'mva': ('MW', 0.95),  # Approximate MW from MVA
+    'mwh': ('MWh', 1.0),
+    'gwh': ('MWh', 1000.0),
+    'twh': ('MWh', 1000000.0),
+    'kv': ('kV', 1.0),
+    'mv': ('kV', 1000.0),
+    'gv': ('kV', 1000000.0),
+    'km': ('km', 1.0),
+    'm': ('km', 0.001),
+    'meter': ('km', 0.001),
+    'meters': ('km', 0.001),
+    '€': ('EUR', 1.0),
+    'm€': ('EUR', 1e6),
+    'million': ('EUR', 1e6),
+    'b€': ('EUR', 1e9),
+    'billion': ('EUR', 1e9)
+}
+
+# Columns of the columnar numerical data batches
+NUMERIC_COLUMNS = ('page', 'value', 'unit', 'category')
+
+# Per-page result lists and the JSONL record type each one is streamed as
+PAGE_RECORD_TYPES = {
+    'capacity_info': 'capacity',
+    'connection_info': 'connection',
+    'constraint_info': 'constraint',
+    'investment_info': 'investment',
+    'numerical_data': 'numerical'
+}
+
+# Page triage: pages are classified from their object counts before any layout
+# analysis, and only text and table pages go through extract_text
+PAGE_TYPES = ('text', 'table_heavy', 'image_only')
+TRIAGE_EXTRACTOR = 'triage'     # Page text cache "extractor" holding the page types
+TRIAGE_MIN_CHARS = 50           # Fewer characters: blank page, cover or full-page image
+TRIAGE_GRAPHICS_CHARS = 400     # Below this, a page is judged by its images
+TRIAGE_IMAGE_COVERAGE = 0.5     # Share of the page covered by images on map and photo plates
+TRIAGE_CURVES_PER_CHAR = 2.0    # Vector maps draw far more curves than they have labels
+TRIAGE_TABLE_EDGES = 24         # Ruling lines and cell rectangles of a ruled table
+TRIAGE_TABLE_DIGITS = 0.3       # Digit share of the raw text of an unruled table
+
+# Table stage: table-heavy pages run pdfplumber's table finder once; the raw
+# cell rows are cached and typed into capacity records per row
+TABLES_EXTRACTOR = 'tables'     # Page text cache "extractor" holding the raw table rows as JSON
+OUTSIDE_TABLES_EXTRACTOR = 'pdfplumber-outside-tables'  # ... and the page text outside the tables
+TABLE_HEADER_ROWS = 2           # Rows searched for column headers
+TABLE_COLUMN_KEYWORDS = (
+    ('voltage', ('kv', 'voltage', 'jännite', 'spänning')),
+    ('capacity', ('mw', 'gw', 'mva', 'capacity', 'kapasiteetti', 'teho', 'effekt', 'kapacitet')),
+    ('year', ('year', 'vuosi', 'år', 'commissioning', 'käyttöönotto', 'idrifttagning')),
+    ('substation', ('substation', 'station', 'node', 'location', 'site', 'asema', 'ställverk'))
+)
+TABLE_TOTAL_LABELS = ('total', 'yhteensä', 'summa', 'totalt', 'sum')  # Summary rows are not projects
+TABLE_VALUE_PATTERN = re.compile(
+    r'(?<![\w.,])(?P<number>\d+(?:[ \u00a0]\d+)*)(?:(?P<separator>[.,])(?P<fraction>\d+))?'
+    r'\s*(?P<unit>GW|MW|MVA|kV)?(?!\w)',
+    re.IGNORECASE
+)
+TABLE_UNIT_PATTERN = re.compile(r'\b(GW|MW|MVA|kV)\b', re.IGNORECASE)
+
+# Deduplication of repeated sentence records (headers, footers, legal boilerplate):
+# exact repeats by content hash, near repeats by SimHash over word shingles
+DEDUP_RECORD_TYPES = ('capacity', 'connection', 'constraint', 'investment')
+DEDUP_VALUE_TYPES = ('capacity', 'investment')  # Near repeats must also carry the same numbers
+DEDUP_SHINGLE_WORDS = 3         # Words per shingle, so word order and neighbours count
+DEDUP_MAX_DISTANCE = 3          # Fingerprint bits in which near repeats may differ (one changed
+                                # word moves a 20-30 word sentence about 10 bits)
+DEDUP_BLOCKS = 4                # Index blocks per fingerprint: repeats within 3 bits always share one
+DEDUP_MIN_NEAR_WORDS = 20       # Shorter sentences (mostly single facts) only collapse when identical
+DEDUP_MAX_ENTRIES = 50000       # Distinct sentences remembered before the oldest are forgotten
+DEDUP_TOKEN_PATTERN = re.compile(r'\w+')
+
+# Analyzer instance of the current worker process (set by the pool initializer)
+_worker_analyzer = None
+
+def _init_worker(analyzer: 'GridDocumentAnalyzer'):
+    """Process pool initializer: keep one analyzer per worker process"""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+def _analyze_page_range(pdf_path: Path, start: int, stop: int,
+                        digest: Optional[str]) -> List[Tuple[int, Dict[str, List[Dict[str, Any]]]]]:
+    """Process pool task: analyze pages [start, stop) of a single document"""
+    analysis = _worker_analyzer._empty_analysis(pdf_path)
+    return list(_worker_analyzer._iter_page_results(pdf_path, analysis, range(start, stop), digest))
+
+def triage_page(page) -> str:
+    """
+    Classify a pdfplumber page as 'text', 'table_heavy' or 'image_only'
+
+    Uses only the page's object counts, image area and a raw-text probe (the
+    characters in content stream order), never the layout analysis of
+    extract_text, so it costs a fraction of an extraction.
+    """
+    chars = page.chars
+    if len(chars) < TRIAGE_MIN_CHARS:
+        return 'image_only'
+    
+    if len(chars) < TRIAGE_GRAPHICS_CHARS and page.images:
+        page_area = float(page.width * page.height) or 1.0
+        image_area = sum(abs((image['x1'] - image['x0']) * (image['bottom'] - image['top']))
+                         for image in page.images)
+        if image_area / page_area >= TRIAGE_IMAGE_COVERAGE:
+            return 'image_only'
+    
+    if len(chars) < TRIAGE_GRAPHICS_CHARS and len(page.curves) >= len(chars) * TRIAGE_CURVES_PER_CHAR:
+        return 'image_only'
+    
+    probe = ''.join(char['text'] for char in chars)
+    digits = sum(map(str.isdigit, probe))
+    if len(page.rects) + len(page.lines) >= TRIAGE_TABLE_EDGES or digits >= len(probe) * TRIAGE_TABLE_DIGITS:
+        return 'table_heavy'
+    return 'text'
+
+def _outside_bboxes(bboxes: List[Tuple[float, float, float, float]]):
+    """pdfplumber filter keeping the objects whose center lies outside all the boxes"""
+    def outside(obj) -> bool:
+        x = (obj.get('x0', 0) + obj.get('x1', 0)) / 2
+        y = (obj.get('top', 0) + obj.get('bottom', 0)) / 2
+        return not any(x0 <= x <= x1 and top <= y <= bottom for x0, top, x1, bottom in bboxes)
+    return outside
+
+def extract_page_tables(page) -> Tuple[str, List[List[List[Optional[str]]]]]:
+    """
+    Run the table stage on a pdfplumber page
+
+    Tables are detected once; their cells are returned as rows and the text
+    outside the tables is extracted for sentence analysis, so table cells are
+    neither split on '.' nor counted twice.
+
+    Returns:
+        Tuple of (text outside the tables, tables as lists of rows of cells)
+    """
+    tables = page.find_tables()
+    rows = [table.extract() for table in tables]
+    if tables:
+        page = page.filter(_outside_bboxes([table.bbox for table in tables]))
+    return page.extract_text() or '', rows
+
+def parse_table_value(cell: str) -> Optional[Tuple[str, float, Optional[str]]]:
+    """
+    Parse the first number of a table cell
+
+    Accepts space-separated thousands ("1 200", "12 500") and decimal commas
+    ("2,5"); a comma followed by exactly three digits is a thousands separator.
+    Spaces only separate thousands when every group after the first has
+    exactly three digits and the first has fewer; other space-separated digits
+    ("110 220", "1 20") are several values, and the cell is left unparsed.
+
+    Returns:
+        Tuple of (number as written, value, unit or None), or None without a
+        (single) number
+    """
+    match = TABLE_VALUE_PATTERN.search(cell)
+    if not match:
+        return None
+    written = match.group('number')
+    groups = re.split(r'[ \u00a0]', written)
+    if len(groups) > 1 and (len(groups[0]) >= 3 or any(len(group) != 3 for group in groups[1:])):
+        return None
+    number = ''.join(groups)
+    fraction = match.group('fraction')
+    if fraction is not None:
+        written += match.group('separator') + fraction
+        if match.group('separator') == ',' and len(fraction) == 3:
+            number += fraction
+        else:
+            number += '.' + fraction
+    return written, float(number), match.group('unit')
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    Segment text into sentences
+
+    Returns (start, end) offsets into ``text`` without the terminating
+    punctuation and the whitespace after it; callers slice out only the
+    sentences they keep. Empty sentences (after a final '.') are dropped.
+    """
+    bounds = [0, *chain.from_iterable(match.span() for match in SENTENCE_END_PATTERN.finditer(text)), len(text)]
+    return [(start, end) for start, end in zip(bounds[::2], bounds[1::2]) if start < end]
+
+def simhash(features: List[str]) -> int:
+    """64-bit SimHash of a list of features (bit-wise majority vote of their hashes)"""
+    if not features:
+        return 0
+    hashes = np.array([hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest() for feature in features])
+    bits = np.unpackbits(np.frombuffer(hashes.tobytes(), dtype=np.uint8).reshape(len(features), 8), axis=1)
+    return int.from_bytes(np.packbits(bits.sum(axis=0) * 2 > len(features)).tobytes(), 'big')
+
+class RecordDeduplicator:
+    """
+    Streaming detector of repeated sentence records
+
+    A record repeats an earlier one when its normalized text (lowercase words,
+    numbers masked) is identical, or when the SimHash fingerprints of their
+    word shingles differ in at most ``max_distance`` bits. Both must also carry
+    the same numbers, except that for connection and constraint records a
+    leading or trailing number (the page number of a header or footer) is
+    ignored. Near repeats are only looked for among sentences of at least
+    DEDUP_MIN_NEAR_WORDS words sharing one of the fingerprint's DEDUP_BLOCKS
+    blocks. Only the ``max_entries`` most recently seen sentences are
+    remembered.
+    """
+
+    def __init__(self, max_entries: int = DEDUP_MAX_ENTRIES, max_distance: int = DEDUP_MAX_DISTANCE):
+        """
+        Initialize deduplicator
+
+        Args:
+            max_entries: Distinct sentences remembered (bounds memory use)
+            max_distance: Fingerprint bits in which near repeats may differ
+        """
+        self.max_entries = max_entries
+        self.max_distance = max_distance
+        bounds = [64 * block // DEDUP_BLOCKS for block in range(DEDUP_BLOCKS + 1)]
+        self._block_masks = [(start, (1 << (end - start)) - 1) for start, end in zip(bounds, bounds[1:])]
+        self._entries: OrderedDict = OrderedDict()  # text key -> (record id, fingerprint, block keys)
+        self._blocks: Dict[Tuple, List[Tuple[int, str]]] = {}
+
+    def add(self, record_type: str, text: str, location: str = '') -> Tuple[str, bool]:
+        """
+        Register a record
+
+        Args:
+            record_type: Record type; records only repeat records of their type
+            text: Sentence text
+            location: Where the record was found (document and page); new
+                records get ids salted with it, so a sentence that returns after
+                being forgotten does not reuse the id of its first occurrence
+
+        Returns:
+            Tuple of (record id, whether the record repeats an earlier one); for
+            repeats the id is the one of the first occurrence
+        """
+        tokens = DEDUP_TOKEN_PATTERN.findall(text.lower())
+        significant = tokens
+        if record_type not in DEDUP_VALUE_TYPES:
+            # Headers and footers carry their page number first or last
+            significant = tokens[1:] if tokens and tokens[0].isdigit() else tokens
+            significant = significant[:-1] if significant and significant[-1].isdigit() else significant
+        numbers = tuple(token for token in significant if token.isdigit())
+        words = ['#' if token.isdigit() else token for token in tokens]
+        text_key = f"{record_type}\0{' '.join(words)}\0{' '.join(numbers)}"
+        entry = self._entries.get(text_key)
+        if entry is not None:
+            self._entries.move_to_end(text_key)
+            return entry[0], True
+        
+        fingerprint, block_keys = 0, []
+        if len(words) >= DEDUP_MIN_NEAR_WORDS:
+            size = DEDUP_SHINGLE_WORDS
+            fingerprint = simhash([' '.join(words[i:i + size]) for i in range(len(words) - size + 1)])
+            block_keys = [(record_type, numbers, start, (fingerprint >> start) & mask)
+                          for start, mask in self._block_masks]
+        
+        for key in block_keys:
+            for other_fingerprint, other_key in self._blocks.get(key, ()):
+                if bin(fingerprint ^ other_fingerprint).count('1') <= self.max_distance:
+                    self._entries.move_to_end(other_key)
+                    return self._entries[other_key][0], True
+        
+        record_id = hashlib.blake2b(f"{text_key}\0{location}".encode('utf-8'), digest_size=8).hexdigest()
+        self._entries[text_key] = (record_id, fingerprint, block_keys)
+        for key in block_keys:
+            self._blocks.setdefault(key, []).append((fingerprint, text_key))
+        
+        if len(self._entries) > self.max_entries:
+            old_key, (_, old_fingerprint, old_block_keys) = self._entries.popitem(last=False)
+            for key in old_block_keys:
+                bucket = self._blocks[key]
+                bucket.remove((old_fingerprint, old_key))
+                if not bucket:
+                    del self._blocks[key]
+        
+        return record_id, False
+
+def normalize_quantity(value: str, unit: str) -> Tuple[float, str]:
+    """Convert a matched number and unit to a float in MW, MWh, kV, km or EUR"""
+    normalized_unit, scale = UNIT_NORMALIZATION[unit.lower()]
+    return float(value.replace(',', '')) * scale, normalized_unit
+
+def numerical_frame(batch: Dict[str, List]) -> pd.DataFrame:
+    """Build a typed DataFrame from a columnar numerical data batch"""
+    frame = pd.DataFrame({column: batch[column] for column in NUMERIC_COLUMNS})
+    return frame.astype({'page': 'int64', 'value': 'float64'})
+
+def read_jsonl(path: str, record_types: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the records of a streamed JSONL analysis export
+
+    Args:
+        path: Path to a file written by GridDocumentAnalyzer.export_to_jsonl
+        record_types: Only yield records of these types (all records if not given)
+
+    Yields:
+        One record dict per line
+    """
+    # export_to_jsonl writes record_type first, so most unwanted lines can be
+    # skipped on their prefix without being parsed
+    prefixes = None
+    if record_types is not None:
+        record_types = set(record_types)
+        prefixes = tuple(f'{{"record_type": {json.dumps(record_type)}' for record_type in record_types)
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            if prefixes is not None and line.startswith('{"record_type": ') and not line.startswith(prefixes):
+                continue
+            record = json.loads(line)
+            if record_types is None or record.get('record_type') in record_types:
+                yield record
+
+def keyword_trie_pattern(keywords) -> str:
+    """
+    Build a regex alternation shaped as a prefix trie over the given keywords
+
+    Shared prefixes are tested once per position instead of once per keyword,
+    and the greedy optional branches make the pattern prefer the longest keyword.
+    """
+    trie: Dict[str, Dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node: Dict[str, Dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and '' not in node:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')' + ('?' if '' in node else '')
+
+    return emit(trie)
+
 class GridDocumentAnalyzer:
     """
     Analyzes existing grid-related PDF documents to extract:
@@ -25,9 +418,24 @@ class GridDocumentAnalyzer:
     - Queue information
     """
     
-    def __init__(self, docs_dir: str = "../docs"):
-        """Initialize analyzer with docs directory"""
+    def __init__(self, docs_dir: str = "../docs", workers: int = 1, pages_per_task: int = 16,
+                 text_cache: Optional[PageTextCache] = None, deduplicate: bool = True):
+        """
+        Initialize analyzer with docs directory
+
+        Args:
+            docs_dir: Directory containing the PDF documents
+            workers: Number of worker processes (1 analyzes serially in-process)
+            pages_per_task: Pages per process pool task in parallel mode
+            text_cache: Optional page text cache; unchanged PDFs are then not re-extracted
+            deduplicate: Collapse repeated sentences (headers, footers, boilerplate)
+                across pages and documents into one record
+        """
         self.docs_dir = Path(docs_dir)
+        self.workers = max(1, workers)
+        self.pages_per_task = max(1, pages_per_task)
+        self.text_cache = text_cache
+        self.deduplicate = deduplicate
         
         # Keywords for different types of grid information
         self.capacity_keywords = [
@@ -51,11 +459,17 @@ class GridDocumentAnalyzer:
             'expansion', 'new line', 'substation', 'transformer'
         ]
 
-    def analyze_fingrid_documents(self) -> Dict[str, Any]:
-        """Analyze all Fingrid documents in the docs folder"""
+        self._build_keyword_matcher()
+
+    def find_fingrid_documents(self) -> List[Path]:
+        """List the Fingrid documents in the docs folder"""
         fingrid_files = list(self.docs_dir.glob("*ingrid*.pdf"))
-        
         logger.info(f"Found {len(fingrid_files)} Fingrid documents to analyze")
+        return fingrid_files
+
+    def analyze_fingrid_documents(self) -> Dict[str, Any]:
+        """Analyze all Fingrid documents in the docs folder"""
+        fingrid_files = self.find_fingrid_documents()
         
         results = {
             'documents_analyzed': len(fingrid_files),
@@ -66,9 +480,19 @@ class GridDocumentAnalyzer:
             'document_summaries': {}
         }
         
-        for pdf_file in fingrid_files:
-            logger.info(f"Analyzing: {pdf_file.name}")
-            doc_analysis = self.analyze_pdf(pdf_file)
+        if self.workers > 1:
+            doc_analyses = self.analyze_pdfs_parallel(fingrid_files)
+        else:
+            doc_analyses = map(self.analyze_pdf, fingrid_files)
+        
+        deduplicator = RecordDeduplicator() if self.deduplicate else None
+        canonical_records: Dict[str, Dict[str, Any]] = {}
+        
+        for pdf_file, doc_analysis in zip(fingrid_files, doc_analyses):
+            logger.info(f"Analyzed: {pdf_file.name}")
+            
+            if deduplicator is not None:
+                self._deduplicate_analysis(doc_analysis, deduplicator, canonical_records)
             
             # Store document summary
             results['document_summaries'][pdf_file.name] = doc_analysis
@@ -81,9 +505,120 @@ class GridDocumentAnalyzer:
         
         return results
 
-    def analyze_pdf(self, pdf_path: Path) -> Dict[str, Any]:
-        """Analyze a single PDF document"""
-        analysis = {
+    def _deduplicate_analysis(self, analysis: Dict[str, Any], deduplicator: RecordDeduplicator,
+                              canonical_records: Dict[str, Dict[str, Any]]):
+        """
+        Collapse repeated sentence records of a document analysis
+
+        The first occurrence of a sentence is kept with a 'record_id' and a list
+        of (document, page) 'occurrences'; later repeats, in this or an earlier
+        document, are dropped and only add to that list. Sets
+        analysis['duplicate_points'].
+        """
+        duplicates = 0
+        for record_type in DEDUP_RECORD_TYPES:
+            kept = []
+            for item in analysis[f'{record_type}_info']:
+                occurrence = [analysis['file_name'], item['page']]
+                record_id, repeated = deduplicator.add(record_type, item['text'],
+                                                       f"{analysis['file_name']}\0{item['page']}")
+                if repeated and record_id in canonical_records:
+                    canonical_records[record_id]['occurrences'].append(occurrence)
+                    duplicates += 1
+                    continue
+                item['record_id'] = record_id
+                item['occurrences'] = [occurrence]
+                canonical_records[record_id] = item
+                kept.append(item)
+            analysis[f'{record_type}_info'] = kept
+        analysis['duplicate_points'] = duplicates
+
+    def analyze_pdfs_parallel(self, pdf_files: List[Path]) -> List[Dict[str, Any]]:
+        """
+        Analyze several PDF documents on a process pool
+
+        Every document is split into page ranges of ``pages_per_task`` pages and all
+        ranges are fanned out to ``workers`` processes. Range results are merged back
+        in document/page order, so the output is identical to a serial run.
+        """
+        analyses, tasks = self._plan_page_ranges(pdf_files)
+        
+        for (doc_index, _, _, _, _), page_results in self._iter_page_range_results(tasks):
+            for _, page_result in page_results:
+                self._merge_page_result(analyses[doc_index], page_result)
+        
+        return analyses
+
+    def _plan_page_ranges(self, pdf_files: List[Path]) -> Tuple[List[Dict[str, Any]], List[Tuple]]:
+        """
+        Split documents into page-range tasks for the process pool
+
+        Returns:
+            Tuple of (empty per-document analyses with page counts set,
+            tasks as (document index, path, start page, stop page, digest))
+        """
+        analyses = []
+        tasks = []
+        
+        for doc_index, pdf_file in enumerate(pdf_files):
+            analysis = self._empty_analysis(pdf_file)
+            analyses.append(analysis)
+            digest = None
+            try:
+                if self.text_cache is not None:
+                    digest = self.text_cache.file_digest(pdf_file)
+                    analysis['pages_processed'] = self.text_cache.get_page_count(digest) or 0
+                if not analysis['pages_processed']:
+                    with pdfplumber.open(pdf_file) as pdf:
+                        analysis['pages_processed'] = len(pdf.pages)
+            except Exception as e:
+                logger.error(f"Error analyzing {pdf_file.name}: {e}")
+                continue
+            
+            for start in range(0, analysis['pages_processed'], self.pages_per_task):
+                stop = min(start + self.pages_per_task, analysis['pages_processed'])
+                tasks.append((doc_index, pdf_file, start, stop, digest))
+        
+        logger.info(f"Analyzing {len(pdf_files)} documents as {len(tasks)} page ranges "
+                    f"on {self.workers} workers")
+        return analyses, tasks
+
+    def _iter_page_range_results(self, tasks: List[Tuple]) -> Iterator[Tuple[Tuple, List]]:
+        """
+        Run page-range tasks on the process pool and yield their results in task order
+
+        At most a few tasks per worker are in flight, so finished results never pile
+        up faster than the caller consumes them. Failed ranges yield no pages.
+        """
+        max_pending = self.workers * 4
+        
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self,)) as executor:
+            pending = deque()
+            task_iter = iter(tasks)
+            
+            for task in task_iter:
+                pending.append((task, executor.submit(_analyze_page_range, *task[1:])))
+                if len(pending) >= max_pending:
+                    break
+            
+            while pending:
+                task, future = pending.popleft()
+                next_task = next(task_iter, None)
+                if next_task is not None:
+                    pending.append((next_task, executor.submit(_analyze_page_range, *next_task[1:])))
+                
+                _, pdf_file, start, stop, _ = task
+                try:
+                    page_results = future.result()
+                except Exception as e:
+                    logger.error(f"Error analyzing pages {start}-{stop - 1} of {pdf_file.name}: {e}")
+                    page_results = []
+                yield task, page_results
+
+    def _empty_analysis(self, pdf_path: Path) -> Dict[str, Any]:
+        """Create an empty per-document analysis record"""
+        return {
             'file_name': pdf_path.name,
             'pages_processed': 0,
             'capacity_info': [],
@@ -91,151 +626,412 @@ class GridDocumentAnalyzer:
             'constraint_info': [],
             'investment_info': [],
             'key_sections': [],
-            'numerical_data': []
+            'skipped_pages': [],
+            'numerical_data': {column: [] for column in NUMERIC_COLUMNS}
         }
+
+    def analyze_pdf(self, pdf_path: Path, page_range: Optional[range] = None,
+                    digest: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Analyze a single PDF document
+
+        Args:
+            pdf_path: Path to the PDF document
+            page_range: Page indices to analyze (all pages if not given)
+            digest: Precomputed content hash of the file for the text cache
+        """
+        analysis = self._empty_analysis(pdf_path)
+        
+        try:
+            for _, page_result in self._iter_page_results(pdf_path, analysis, page_range, digest):
+                self._merge_page_result(analysis, page_result)
+                        
+        except Exception as e:
+            logger.error(f"Error analyzing {pdf_path.name}: {e}")
+            
+        return analysis
+
+    def analyze_page(self, text: str, page_num: int,
+                     tables: Optional[List[List[List[Optional[str]]]]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Analyze the text (and, on table-heavy pages, the tables) of a single page"""
+        # Look for capacity, connection, constraint and investment
+        # information in a single pass over the page
+        page_result = self.classify_page(text, page_num)
+        
+        # Typed capacity rows from the page's tables
+        if tables:
+            page_result['capacity_info'].extend(self.extract_table_capacity(tables, page_num))
+        
+        # Extract numerical data (MW, GW, voltage levels, etc.)
+        page_result['numerical_data'] = self.extract_numerical_data(text, page_num)
+        
+        return page_result
+
+    def _merge_page_result(self, analysis: Dict[str, Any], page_result: Dict[str, Any]):
+        """Append one page result to a document analysis"""
+        for key, matches in page_result.items():
+            if key == 'numerical_data':
+                for column, values in matches.items():
+                    analysis[key][column].extend(values)
+            else:
+                analysis[key].extend(matches)
+
+    def _iter_page_results(self, pdf_path: Path, analysis: Dict[str, Any],
+                           page_range: Optional[range] = None, digest: Optional[str] = None):
+        """
+        Yield (page index, page result) for every page of a document that has text
+
+        Pages triaged as image-only yield a result that only lists them in
+        'skipped_pages'.
+        """
+        for page_num, text, page_type, tables in self._iter_page_texts(pdf_path, analysis, page_range, digest):
+            if page_type == 'image_only':
+                yield page_num, {'skipped_pages': [page_num]}
+                continue
+            if not text and not tables:
+                continue
+            try:
+                yield page_num, self.analyze_page(text, page_num, tables)
+            except Exception as e:
+                logger.warning(f"Error processing page {page_num} of {pdf_path.name}: {e}")
+                continue
+
+    def _iter_page_texts(self, pdf_path: Path, analysis: Dict[str, Any],
+                         page_range: Optional[range] = None, digest: Optional[str] = None,
+                         flush_every: int = 32):
+        """
+        Yield (page index, text, page type, tables) for the requested pages of a document
+
+        Every page is triaged (see triage_page) before extraction; image-only pages
+        yield no text and never reach extract_text, and table-heavy pages go
+        through the table stage (see extract_page_tables) instead of plain text
+        extraction. Tables are None on all other pages. Pages, page types and
+        tables found in the text cache are served from it; pdfplumber only opens
+        the document when at least one requested page is missing, and newly
+        extracted results are written back to the cache. Sets
+        analysis['pages_processed'].
+        """
+        cached: Dict[int, str] = {}
+        page_types: Dict[int, str] = {}
+        cached_tables: Dict[int, str] = {}
+        cached_outside: Dict[int, str] = {}
+        if self.text_cache is not None:
+            if digest is None:
+                digest = self.text_cache.file_digest(pdf_path)
+            page_count, cached = self.text_cache.get_pages(digest)
+            page_types = self.text_cache.get_pages(digest, TRIAGE_EXTRACTOR)[1]
+            cached_tables = self.text_cache.get_pages(digest, TABLES_EXTRACTOR)[1]
+            cached_outside = self.text_cache.get_pages(digest, OUTSIDE_TABLES_EXTRACTOR)[1]
+            
+            def is_cached(page_num: int) -> bool:
+                # Pages cached without a page type (e.g. by the harvester) still need triage
+                page_type = page_types.get(page_num)
+                if page_type == 'table_heavy':
+                    return page_num in cached_outside and page_num in cached_tables
+                if page_type == 'text':
+                    return page_num in cached
+                return page_type == 'image_only'
+            
+            if page_count is not None:
+                wanted = range(page_count) if page_range is None else page_range
+                if all(is_cached(page_num) for page_num in wanted):
+                    analysis['pages_processed'] = page_count
+                    for page_num in wanted:
+                        page_type = page_types[page_num]
+                        if page_type == 'table_heavy':
+                            yield page_num, cached_outside[page_num], page_type, json.loads(cached_tables[page_num])
+                        else:
+                            yield page_num, cached.get(page_num), page_type, None
+                    return
+        
+        extracted: Dict[int, str] = {}
+        triaged: Dict[int, str] = {}
+        tabled: Dict[int, str] = {}
+        outside: Dict[int, str] = {}
+        
+        def flush():
+            self.text_cache.put_pages(digest, analysis['pages_processed'], extracted)
+            self.text_cache.put_pages(digest, analysis['pages_processed'], triaged, TRIAGE_EXTRACTOR)
+            self.text_cache.put_pages(digest, analysis['pages_processed'], tabled, TABLES_EXTRACTOR)
+            self.text_cache.put_pages(digest, analysis['pages_processed'], outside, OUTSIDE_TABLES_EXTRACTOR)
+            extracted.clear()
+            triaged.clear()
+            tabled.clear()
+            outside.clear()
         
         try:
             with pdfplumber.open(pdf_path) as pdf:
                 analysis['pages_processed'] = len(pdf.pages)
                 
-                for page_num, page in enumerate(pdf.pages):
+                if page_range is None:
+                    page_range = range(len(pdf.pages))
+                
+                for page_num in page_range:
+                    text = cached.get(page_num)
+                    page_type = page_types.get(page_num)
+                    tables = None
                     try:
-                        text = page.extract_text()
-                        if not text:
-                            continue
-                            
-                        # Look for capacity information
-                        capacity_matches = self.extract_capacity_info(text, page_num)
-                        analysis['capacity_info'].extend(capacity_matches)
-                        
-                        # Look for connection information
-                        connection_matches = self.extract_connection_info(text, page_num)
-                        analysis['connection_info'].extend(connection_matches)
-                        
-                        # Look for constraint information
-                        constraint_matches = self.extract_constraint_info(text, page_num)
-                        analysis['constraint_info'].extend(constraint_matches)
-                        
-                        # Look for investment/development information
-                        investment_matches = self.extract_investment_info(text, page_num)
-                        analysis['investment_info'].extend(investment_matches)
-                        
-                        # Extract numerical data (MW, GW, voltage levels, etc.)
-                        numerical_matches = self.extract_numerical_data(text, page_num)
-                        analysis['numerical_data'].extend(numerical_matches)
-                        
+                        if page_type is None:
+                            page_type = triaged[page_num] = triage_page(pdf.pages[page_num])
+                        if page_type == 'table_heavy':
+                            # Text outside the tables has its own cache key; the full
+                            # page text under 'pdfplumber' is what the harvester reads
+                            if page_num in cached_tables and page_num in cached_outside:
+                                text = cached_outside[page_num]
+                                tables = json.loads(cached_tables[page_num])
+                            else:
+                                text, tables = extract_page_tables(pdf.pages[page_num])
+                                outside[page_num] = text
+                                tabled[page_num] = json.dumps(tables, ensure_ascii=False)
+                        elif text is None and page_type != 'image_only':
+                            text = extracted[page_num] = pdf.pages[page_num].extract_text() or ''
                     except Exception as e:
                         logger.warning(f"Error processing page {page_num} of {pdf_path.name}: {e}")
                         continue
-                        
-        except Exception as e:
-            logger.error(f"Error analyzing {pdf_path.name}: {e}")
-            
-        return analysis
+                    
+                    if self.text_cache is not None and len(extracted) + len(triaged) >= flush_every:
+                        flush()
+                    
+                    yield page_num, text, page_type, tables
+        finally:
+            if self.text_cache is not None:
+                flush()
 
-    def extract_capacity_info(self, text: str, page_num: int) -> List[Dict[str, Any]]:
-        """Extract grid capacity information from text"""
-        matches = []
-        
-        # Look for sentences containing capacity keywords
-        sentences = text.split('.')
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if any(keyword.lower() in sentence.lower() for keyword in self.capacity_keywords):
+    def _build_keyword_matcher(self):
+        """Compile all four keyword lists into a single overlapping-match automaton"""
+        keyword_categories: Dict[str, int] = {}
+        for bit, category in enumerate(SENTENCE_CATEGORIES):
+            for keyword in getattr(self, f'{category}_keywords'):
+                keyword = keyword.lower()
+                keyword_categories[keyword] = keyword_categories.get(keyword, 0) | (1 << bit)
+
+        # The lookahead reports only the longest keyword starting at each position,
+        # so every keyword also carries the categories of the keywords it starts with
+        self._keyword_masks = {}
+        for keyword in keyword_categories:
+            mask = 0
+            for other, other_mask in keyword_categories.items():
+                if keyword.startswith(other):
+                    mask |= other_mask
+            self._keyword_masks[keyword] = mask
+
+        self._keyword_pattern = re.compile(f'(?=({keyword_trie_pattern(keyword_categories)}))')
+        self._all_categories_mask = (1 << len(SENTENCE_CATEGORIES)) - 1
+
+    def classify_page(self, text: str, page_num: int) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Classify every sentence of a page against all keyword categories in one pass
+
+        The page is segmented into sentence offsets, lowercased once and scanned
+        once by the combined keyword automaton. Value patterns run on the offsets
+        of the page buffer, and sentences are only materialized when they
+        matched something.
+        """
+        results = {f'{category}_info': [] for category in SENTENCE_CATEGORIES}
+
+        spans = sentence_spans(text)
+        sentence_starts = [start for start, _ in spans]
+        text_lower = text.lower()
+        if len(text_lower) != len(text):
+            # 'İ' is the only character whose lowercase is longer; keep offsets aligned
+            text_lower = text.replace('\u0130', 'i').lower()
+
+        sentence_masks: Dict[int, int] = {}
+        for match in self._keyword_pattern.finditer(text_lower):
+            index = bisect_right(sentence_starts, match.start()) - 1
+            mask = sentence_masks.get(index, 0)
+            if mask != self._all_categories_mask:
+                sentence_masks[index] = mask | self._keyword_masks[match.group(1)]
+
+        if not sentence_masks:
+            return results
+
+        for index in sorted(sentence_masks):
+            mask = sentence_masks[index]
+            start, end = spans[index]
+            sentence = text[start:end].strip()
+
+            if mask & CAPACITY_MASK:
                 # Extract numerical values (MW, GW)
-                numbers = re.findall(r'(\d+(?:,\d{3})*(?:\.\d+)?)\s*(MW|GW|MVA)', sentence, re.IGNORECASE)
+                numbers = CAPACITY_VALUE_PATTERN.findall(text, start, end)
                 if numbers:
-                    matches.append({
+                    results['capacity_info'].append({
                         'page': page_num,
                         'text': sentence,
                         'values': numbers,
+                        'capacity_mw': normalize_quantity(*numbers[0])[0],
                         'type': 'capacity'
                     })
-        
-        return matches
 
-    def extract_connection_info(self, text: str, page_num: int) -> List[Dict[str, Any]]:
-        """Extract grid connection information from text"""
-        matches = []
-        
-        sentences = text.split('.')
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if any(keyword.lower() in sentence.lower() for keyword in self.connection_keywords):
-                matches.append({
+            if mask & CONNECTION_MASK:
+                results['connection_info'].append({
                     'page': page_num,
                     'text': sentence,
                     'type': 'connection'
                 })
-        
-        return matches
 
-    def extract_constraint_info(self, text: str, page_num: int) -> List[Dict[str, Any]]:
-        """Extract grid constraint information from text"""
-        matches = []
-        
-        sentences = text.split('.')
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if any(keyword.lower() in sentence.lower() for keyword in self.constraint_keywords):
-                matches.append({
+            if mask & CONSTRAINT_MASK:
+                results['constraint_info'].append({
                     'page': page_num,
                     'text': sentence,
                     'type': 'constraint'
                 })
-        
-        return matches
 
-    def extract_investment_info(self, text: str, page_num: int) -> List[Dict[str, Any]]:
-        """Extract investment/development information from text"""
-        matches = []
-        
-        sentences = text.split('.')
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if any(keyword.lower() in sentence.lower() for keyword in self.investment_keywords):
+            if mask & INVESTMENT_MASK:
                 # Look for years and costs
-                years = re.findall(r'20\d{2}', sentence)
-                costs = re.findall(r'(\d+(?:,\d{3})*(?:\.\d+)?)\s*(million|billion|M€|B€)', sentence, re.IGNORECASE)
-                
-                matches.append({
+                costs = COST_PATTERN.findall(text, start, end)
+                results['investment_info'].append({
                     'page': page_num,
                     'text': sentence,
-                    'years': years,
+                    'years': YEAR_PATTERN.findall(text, start, end),
                     'costs': costs,
+                    'cost_eur': normalize_quantity(*costs[0])[0] if costs else None,
                     'type': 'investment'
                 })
-        
-        return matches
 
-    def extract_numerical_data(self, text: str, page_num: int) -> List[Dict[str, Any]]:
-        """Extract all numerical data with units"""
-        matches = []
-        
-        # Pattern for numbers with electrical units
-        patterns = [
-            (r'(\d+(?:,\d{3})*(?:\.\d+)?)\s*(MW|GW|MVA|kV|MV|GV)', 'electrical'),
-            (r'(\d+(?:,\d{3})*(?:\.\d+)?)\s*(km|meter|m)', 'distance'),
-            (r'(\d+(?:,\d{3})*(?:\.\d+)?)\s*(€|million|billion)', 'cost'),
-            (r'(20\d{2})', 'year')
-        ]
-        
-        for pattern, data_type in patterns:
-            found = re.findall(pattern, text, re.IGNORECASE)
-            for match in found:
-                if isinstance(match, tuple):
-                    value, unit = match
-                else:
-                    value, unit = match, ''
+        return results
+
+    def _table_columns(self, table: List[List[Optional[str]]]) -> Tuple[int, Dict[str, int], Dict[str, str]]:
+        """
+        Find the header of a table
+
+        Returns:
+            Tuple of (index of the first data row, {role: column index},
+            {role: unit named in the header})
+        """
+        for row_index, row in enumerate(table[:TABLE_HEADER_ROWS]):
+            columns: Dict[str, int] = {}
+            units: Dict[str, str] = {}
+            for column_index, cell in enumerate(row):
+                header = (cell or '').lower()
+                if not header or TABLE_VALUE_PATTERN.fullmatch(header.strip()):
+                    continue
+                for role, keywords in TABLE_COLUMN_KEYWORDS:
+                    if role not in columns and any(keyword in header for keyword in keywords):
+                        columns[role] = column_index
+                        unit = TABLE_UNIT_PATTERN.search(header)
+                        if unit:
+                            units[role] = unit.group(1)
+                        break
+            if 'capacity' in columns:
+                return row_index + 1, columns, units
+        return 0, {}, {}
+
+    def extract_table_capacity(self, tables: List[List[List[Optional[str]]]],
+                               page_num: int) -> List[Dict[str, Any]]:
+        """
+        Type the rows of a page's tables into capacity records
+
+        Columns are assigned from the header (substation, voltage, capacity,
+        year); tables without a recognizable header are typed cell by cell from
+        the units in the cells. Rows without a capacity value and total rows
+        are dropped.
+        """
+        records = []
+        for table in tables:
+            first_row, columns, units = self._table_columns(table)
+            column_roles = {index: role for role, index in columns.items()}
+            
+            for row in table[first_row:]:
+                cells = [' '.join((cell or '').split()) for cell in row]
+                if not any(cells):
+                    continue
+                
+                record = {'substation': None, 'voltage_kv': None, 'capacity_mw': None, 'year': None}
+                values = []
+                for column_index, cell in enumerate(cells):
+                    if not cell:
+                        continue
+                    role = column_roles.get(column_index)
+                    if columns and role is None:
+                        continue
+                    
+                    parsed = None if role == 'substation' else parse_table_value(cell)
+                    if parsed is None:
+                        # Headerless tables: the first cell without a number names the row
+                        if role == 'substation' or (not columns and record['substation'] is None):
+                            record['substation'] = cell
+                        continue
+                    
+                    written, value, unit = parsed
+                    unit = unit or units.get(role)
+                    if role is None:
+                        if unit is not None:
+                            role = 'voltage' if unit.lower() == 'kv' else 'capacity'
+                        elif YEAR_NUMBER_PATTERN.fullmatch(written):
+                            role = 'year'
                     
-                matches.append({
+                    if role == 'capacity' and record['capacity_mw'] is None:
+                        unit = 'MW' if unit is None or unit.lower() == 'kv' else unit.upper()
+                        record['capacity_mw'] = normalize_quantity(str(value), unit)[0]
+                        values.append((written, unit))
+                    elif role == 'voltage' and record['voltage_kv'] is None:
+                        record['voltage_kv'] = value
+                    elif role == 'year' and record['year'] is None and YEAR_NUMBER_PATTERN.fullmatch(written):
+                        record['year'] = int(written)
+                
+                if record['capacity_mw'] is None:
+                    continue
+                if record['substation'] and record['substation'].lower().startswith(TABLE_TOTAL_LABELS):
+                    continue
+                records.append({
                     'page': page_num,
-                    'value': value,
-                    'unit': unit,
-                    'data_type': data_type
+                    'text': ' | '.join(cell for cell in cells if cell),
+                    'values': values,
+                    **record,
+                    'type': 'capacity',
+                    'source': 'table'
                 })
         
-        return matches
+        return records
+
+    def extract_capacity_info(self, text: str, page_num: int) -> List[Dict[str, Any]]:
+        """Extract grid capacity information from text"""
+        return self.classify_page(text, page_num)['capacity_info']
+
+    def extract_connection_info(self, text: str, page_num: int) -> List[Dict[str, Any]]:
+        """Extract grid connection information from text"""
+        return self.classify_page(text, page_num)['connection_info']
+
+    def extract_constraint_info(self, text: str, page_num: int) -> List[Dict[str, Any]]:
+        """Extract grid constraint information from text"""
+        return self.classify_page(text, page_num)['constraint_info']
+
+    def extract_investment_info(self, text: str, page_num: int) -> List[Dict[str, Any]]:
+        """Extract investment/development information from text"""
+        return self.classify_page(text, page_num)['investment_info']
+
+    def extract_numerical_data(self, text: str, page_num: int) -> Dict[str, List]:
+        """
+        Extract all numerical data with units in a single pass
+
+        Values are converted to float and normalized to MW, MWh, kV, km or EUR here, so
+        consumers never re-parse them.
+
+        Returns:
+            Columnar batch {'page': [...], 'value': [...], 'unit': [...],
+            'category': [...]}; see numerical_frame() for a DataFrame view
+        """
+        values = []
+        units = []
+        categories = []
+        
+        for match in NUMERIC_VALUE_PATTERN.finditer(text):
+            number = match.group('number')
+            category = match.lastgroup
+            
+            if category in NUMERIC_UNIT_GROUPS:
+                value, unit = normalize_quantity(number, match.group(category))
+            elif YEAR_NUMBER_PATTERN.fullmatch(number):
+                value, unit, category = float(number), '', 'year'
+            else:
+                continue
+            
+            values.append(value)
+            units.append(unit)
+            categories.append(category)
+        
+        return {'page': [page_num] * len(values), 'value': values, 'unit': units, 'category': categories}
 
     def generate_grid_intelligence_report(self, analysis_results: Dict[str, Any]) -> str:
         """Generate a comprehensive grid intelligence report"""
@@ -281,8 +1077,128 @@ Generated: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}
             json.dump(analysis_results, f, indent=2, ensure_ascii=False, default=str)
         logger.info(f"Results exported to: {output_path}")
 
+    def iter_analysis_records(self, pdf_files: Optional[List[Path]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Analyze documents and yield flat records as pages are analyzed
+
+        Every page yields its capacity, connection, constraint, investment and
+        numerical records tagged with 'record_type' and 'document_source'; each
+        document ends with a 'document' record holding its page and record counts.
+        Only one page (or one in-flight page range per worker) is held in memory.
+        
+        With deduplication, sentence records carry a 'record_id' and a repeat of
+        an earlier sentence is yielded as a small 'duplicate' record (its
+        document_source, page, duplicate_type and duplicate_of) instead.
+        """
+        if pdf_files is None:
+            pdf_files = self.find_fingrid_documents()
+        deduplicator = RecordDeduplicator() if self.deduplicate else None
+        
+        if self.workers > 1:
+            analyses, tasks = self._plan_page_ranges(pdf_files)
+            range_results = self._iter_page_range_results(tasks)
+            
+            for doc_index, analysis in enumerate(analyses):
+                counts = dict.fromkeys(PAGE_RECORD_TYPES.values(), 0)
+                task_count = sum(1 for task in tasks if task[0] == doc_index)
+                for _ in range(task_count):
+                    _, page_results = next(range_results)
+                    for _, page_result in page_results:
+                        yield from self._page_records(analysis['file_name'], page_result, counts, deduplicator)
+                yield self._document_record(analysis, counts)
+            return
+        
+        for pdf_file in pdf_files:
+            analysis = self._empty_analysis(pdf_file)
+            counts = dict.fromkeys(PAGE_RECORD_TYPES.values(), 0)
+            try:
+                for _, page_result in self._iter_page_results(pdf_file, analysis):
+                    yield from self._page_records(pdf_file.name, page_result, counts, deduplicator)
+            except Exception as e:
+                logger.error(f"Error analyzing {pdf_file.name}: {e}")
+            yield self._document_record(analysis, counts)
+
+    def _page_records(self, document_source: str, page_result: Dict[str, List[Dict[str, Any]]],
+                      counts: Dict[str, int],
+                      deduplicator: Optional[RecordDeduplicator] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Flatten one page result into tagged records, updating per-type counts
+
+        Numerical data stays columnar: one 'numerical' record per page holds the
+        column lists of all its values.
+        """
+        for key, record_type in PAGE_RECORD_TYPES.items():
+            if key == 'numerical_data':
+                batch = page_result.get(key)
+                if batch and batch['value']:
+                    counts[record_type] += len(batch['value'])
+                    yield {'record_type': record_type, 'document_source': document_source, **batch}
+                continue
+            
+            for item in page_result.get(key, []):
+                if deduplicator is None:
+                    counts[record_type] += 1
+                    yield {'record_type': record_type, 'document_source': document_source, **item}
+                    continue
+                
+                record_id, repeated = deduplicator.add(record_type, item['text'],
+                                                       f"{document_source}\0{item['page']}")
+                if repeated:
+                    counts['duplicate'] = counts.get('duplicate', 0) + 1
+                    yield {'record_type': 'duplicate', 'document_source': document_source, 'page': item['page'],
+                           'duplicate_type': record_type, 'duplicate_of': record_id}
+                else:
+                    counts[record_type] += 1
+                    yield {'record_type': record_type, 'document_source': document_source,
+                           'record_id': record_id, **item}
+        
+        counts['skipped'] = counts.get('skipped', 0) + len(page_result.get('skipped_pages', []))
+
+    def _document_record(self, analysis: Dict[str, Any], counts: Dict[str, int]) -> Dict[str, Any]:
+        """Build the closing summary record of a streamed document"""
+        return {
+            'record_type': 'document',
+            'file_name': analysis['file_name'],
+            'pages_processed': analysis['pages_processed'],
+            'capacity_points': counts['capacity'],
+            'connection_points': counts['connection'],
+            'constraint_points': counts['constraint'],
+            'investment_points': counts['investment'],
+            'numerical_points': counts['numerical'],
+            'pages_skipped': counts.get('skipped', 0),
+            'duplicate_points': counts.get('duplicate', 0)
+        }
+
+    def export_to_jsonl(self, output_path: str, pdf_files: Optional[List[Path]] = None) -> Dict[str, int]:
+        """
+        Stream analysis results to a JSON Lines file, one record per line
+
+        Records are written as pages are analyzed, so memory use does not grow with
+        the size of the corpus. Each 'document' record gets a content_hash over the
+        lines of its document's records. Read the file back with read_jsonl().
+
+        Returns:
+            Number of records written per record type
+        """
+        written: Dict[str, int] = {}
+        document_hash = hashlib.sha256()
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for record in self.iter_analysis_records(pdf_files):
+                if record['record_type'] == 'document':
+                    record['content_hash'] = document_hash.hexdigest()
+                    document_hash = hashlib.sha256()
+                
+                line = json.dumps(record, ensure_ascii=False, default=str)
+                if record['record_type'] != 'document':
+                    document_hash.update(line.encode('utf-8'))
+                f.write(line)
+                f.write('\n')
+                written[record['record_type']] = written.get(record['record_type'], 0) + 1
+        logger.info(f"Results streamed to: {output_path}")
+        return written
+
 if __name__ == "__main__":
-    analyzer = GridDocumentAnalyzer()
+    analyzer = GridDocumentAnalyzer(workers=os.cpu_count() or 1, text_cache=PageTextCache())
     results = analyzer.analyze_fingrid_documents()
     
     # Generate report
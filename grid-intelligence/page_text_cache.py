@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Page Text Cache for PDF extraction
+Persistent on-disk cache of extracted PDF page text shared by the document
+analyzer and the TSO document harvester
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import logging
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class PageTextCache:
+    """
+    SQLite-backed cache of extracted page text
+
+    Entries are keyed by the SHA-256 of the PDF file contents, the extractor that
+    produced the text (pdfplumber, pypdf2, ...) and the page index, so renamed or
+    re-downloaded copies of the same file hit the cache and changed files miss it.
+    Whole documents are evicted least-recently-used first once the cached text
+    exceeds ``max_bytes``.
+    """
+
+    def __init__(self, cache_path: str = "data/page_text_cache.db",
+                 max_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialize page text cache
+
+        Args:
+            cache_path: Path to the SQLite cache file
+            max_bytes: Size cap for cached page text before LRU eviction
+        """
+        self.cache_path = Path(cache_path)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+    def __getstate__(self):
+        # Connections cannot cross process boundaries; workers open their own
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, creating the schema on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.cache_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS documents (
+            digest TEXT PRIMARY KEY,
+            page_count INTEGER,
+            text_bytes INTEGER DEFAULT 0,
+            last_access REAL
+        )
+        """)
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS pages (
+            digest TEXT NOT NULL,
+            extractor TEXT NOT NULL,
+            page_index INTEGER NOT NULL,
+            text TEXT,
+            PRIMARY KEY (digest, extractor, page_index)
+        ) WITHOUT ROWID
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_last_access ON documents(last_access)")
+        conn.commit()
+
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def file_digest(path, chunk_size: int = 1024 * 1024) -> str:
+        """Compute the SHA-256 content hash of a file"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get_page_count(self, digest: str) -> Optional[int]:
+        """Get the page count of a cached document, or None if it is not cached"""
+        row = self._connect().execute(
+            "SELECT page_count FROM documents WHERE digest = ?", (digest,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_page(self, digest: str, page_index: int,
+                 extractor: str = 'pdfplumber') -> Tuple[bool, Optional[str]]:
+        """
+        Get one cached page of a document
+
+        Args:
+            digest: Content hash of the PDF file
+            page_index: Zero-based page index
+            extractor: Name of the text extractor
+
+        Returns:
+            Tuple of (whether the page is cached, its text)
+        """
+        row = self._connect().execute(
+            "SELECT text FROM pages WHERE digest = ? AND extractor = ? AND page_index = ?",
+            (digest, extractor, page_index)
+        ).fetchone()
+        return (True, row[0]) if row else (False, None)
+
+    def touch(self, digest: str):
+        """Mark a document as recently used"""
+        conn = self._connect()
+        with conn:
+            conn.execute("UPDATE documents SET last_access = ? WHERE digest = ?", (time.time(), digest))
+
+    def get_pages(self, digest: str,
+                  extractor: str = 'pdfplumber') -> Tuple[Optional[int], Dict[int, Optional[str]]]:
+        """
+        Get all cached pages of a document
+
+        Args:
+            digest: Content hash of the PDF file
+            extractor: Name of the text extractor
+
+        Returns:
+            Tuple of (page count or None if unknown, {page index: text})
+        """
+        conn = self._connect()
+        row = conn.execute("SELECT page_count FROM documents WHERE digest = ?", (digest,)).fetchone()
+        if row is None:
+            return None, {}
+
+        pages = dict(conn.execute(
+            "SELECT page_index, text FROM pages WHERE digest = ? AND extractor = ?",
+            (digest, extractor)
+        ))
+        conn.execute("UPDATE documents SET last_access = ? WHERE digest = ?", (time.time(), digest))
+        conn.commit()
+        return row[0], pages
+
+    def put_pages(self, digest: str, page_count: int, pages: Dict[int, Optional[str]],
+                  extractor: str = 'pdfplumber'):
+        """
+        Store extracted page text for a document
+
+        Args:
+            digest: Content hash of the PDF file
+            page_count: Total number of pages in the document
+            pages: {page index: text}; '' for pages without text, None for pages
+                the extractor failed on
+            extractor: Name of the text extractor
+        """
+        if not pages:
+            return
+
+        conn = self._connect()
+        with conn:
+            conn.execute("""
+            INSERT INTO documents (digest, page_count, text_bytes, last_access) VALUES (?, ?, 0, ?)
+            ON CONFLICT(digest) DO UPDATE SET
+                page_count = excluded.page_count,
+                last_access = excluded.last_access
+            """, (digest, page_count, time.time()))
+            conn.executemany(
+                "INSERT OR REPLACE INTO pages (digest, extractor, page_index, text) VALUES (?, ?, ?, ?)",
+                ((digest, extractor, page_index, text) for page_index, text in pages.items())
+            )
+            # Recount from the stored rows so rewritten pages are not counted twice
+            conn.execute("""
+            UPDATE documents SET text_bytes = (
+                SELECT COALESCE(SUM(LENGTH(CAST(text AS BLOB))), 0) FROM pages WHERE digest = ?
+            ) WHERE digest = ?
+            """, (digest, digest))
+        self.evict()
+
+    def evict(self):
+        """Evict least recently used documents until the cache fits in max_bytes"""
+        conn = self._connect()
+        total = conn.execute("SELECT COALESCE(SUM(text_bytes), 0) FROM documents").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        with conn:
+            for digest, text_bytes in conn.execute(
+                    "SELECT digest, text_bytes FROM documents ORDER BY last_access").fetchall():
+                if total <= self.max_bytes:
+                    break
+                conn.execute("DELETE FROM pages WHERE digest = ?", (digest,))
+                conn.execute("DELETE FROM documents WHERE digest = ?", (digest,))
+                total -= text_bytes
+                evicted += 1
+
+        logger.info(f"Evicted {evicted} documents from page text cache ({total} bytes cached)")
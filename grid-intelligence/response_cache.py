@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+HTTP Response Cache for grid data APIs
+Persistent on-disk cache of API responses shared by the ENTSO-E and Fingrid
+clients, with conditional revalidation of expired entries
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from email.utils import formatdate
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+from urllib.parse import urlencode
+import logging
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Request parameters that carry credentials and never become part of a cache key
+SECRET_PARAMS = ('securityToken', 'api_key', 'apikey', 'token')
+
+class CachedResponse:
+    """
+    Minimal stand-in for a streamed requests.Response
+
+    Serves a body from the cache, or passes a live response through while
+    teeing its body into the cache. The cache entry is only committed once the
+    body has been read completely; a partially read body is discarded.
+    """
+
+    def __init__(self, status_code: int, body_path: Optional[Path] = None, response: Any = None,
+                 part_path: Optional[Path] = None, on_complete: Optional[Callable[[int], None]] = None):
+        """
+        Initialize cached response
+
+        Args:
+            status_code: HTTP status of the response
+            body_path: Cached body file (for responses served from the cache)
+            response: Live streamed response (for responses written through)
+            part_path: Temporary file the live body is teed into
+            on_complete: Called with the body size once the tee has completed
+        """
+        self.status_code = status_code
+        self.from_cache = body_path is not None
+        self._body_path = body_path
+        self._response = response
+        self._part_path = part_path
+        self._on_complete = on_complete
+        self._content = None
+
+    def iter_content(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Iterate over the response body"""
+        if self._content is not None:
+            yield self._content
+            return
+
+        if self._body_path is not None:
+            with open(self._body_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(chunk_size), b''):
+                    yield chunk
+            return
+
+        if self._part_path is None:
+            yield from self._response.iter_content(chunk_size=chunk_size)
+            return
+
+        size = 0
+        with open(self._part_path, 'wb') as part:
+            for chunk in self._response.iter_content(chunk_size=chunk_size):
+                part.write(chunk)
+                size += len(chunk)
+                yield chunk
+
+        self._part_path = None
+        self._on_complete(size)
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = b''.join(self.iter_content())
+        return self._content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self._response is not None:
+            self._response.raise_for_status()
+
+    def close(self):
+        if self._response is not None:
+            self._response.close()
+        if self._part_path is not None:
+            # Body was not read to the end; never commit a truncated entry
+            self._part_path.unlink(missing_ok=True)
+            self._part_path = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class ResponseCache:
+    """
+    Persistent HTTP response cache
+
+    Entries are keyed by the URL and the normalized query parameters with
+    credentials stripped. Responses for closed historical windows never expire;
+    all other responses expire after ``ttl_seconds`` and are then revalidated
+    with If-None-Match / If-Modified-Since. Bodies live in files next to an
+    SQLite index and are evicted least-recently-used first once they exceed
+    ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: str = "data/response_cache", max_bytes: int = 1024 * 1024 * 1024,
+                 ttl_seconds: int = 3600, settle_delay: timedelta = timedelta(days=2)):
+        """
+        Initialize response cache
+
+        Args:
+            cache_dir: Directory for the index and the response bodies
+            max_bytes: Size cap for cached bodies before LRU eviction
+            ttl_seconds: Lifetime of responses for open (recent) windows
+            settle_delay: Age after which a window's data is treated as final
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.settle_delay = settle_delay
+        self._conn = None
+        self._conn_pid = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Connections and locks cannot cross process boundaries
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        state['_conn_pid'] = None
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this process's connection, creating the schema on first use"""
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+
+        (self.cache_dir / 'bodies').mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.cache_dir / 'index.db', timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at REAL NOT NULL,
+            expires_at REAL,
+            last_access REAL NOT NULL
+        )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+        conn.commit()
+
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Cache key of a request: URL plus sorted parameters without credentials"""
+        normalized = sorted(
+            (str(name), str(value)) for name, value in (params or {}).items()
+            if name not in SECRET_PARAMS
+        )
+        return hashlib.sha256(f"{url}?{urlencode(normalized)}".encode('utf-8')).hexdigest()
+
+    def expiry_for(self, window_end: Optional[datetime] = None) -> Optional[float]:
+        """
+        Expiry time for a response covering data up to ``window_end``
+
+        Returns None (never expires) for windows that ended more than
+        ``settle_delay`` ago, otherwise now + ttl_seconds.
+        """
+        if window_end is not None and window_end <= datetime.now() - self.settle_delay:
+            return None
+        return time.time() + self.ttl_seconds
+
+    def _body_path(self, key: str) -> Path:
+        return self.cache_dir / 'bodies' / f"{key}.body"
+
+    def lookup(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find the cache entry of a request
+
+        Returns:
+            Entry with 'key', 'etag', 'last_modified', 'expires_at' and 'fresh'
+            (servable without contacting the server), or None on a miss
+        """
+        key = self.make_key(url, params)
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT etag, last_modified, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or not self._body_path(key).exists():
+            return None
+
+        etag, last_modified, expires_at = row
+        return {
+            'key': key,
+            'etag': etag,
+            'last_modified': last_modified,
+            'expires_at': expires_at,
+            'fresh': expires_at is None or expires_at > time.time()
+        }
+
+    def is_fresh(self, url: str, params: Optional[Dict[str, Any]] = None) -> bool:
+        """Check whether a request can be answered from the cache alone"""
+        entry = self.lookup(url, params)
+        return entry is not None and entry['fresh']
+
+    def get(self, session, url: str, params: Optional[Dict[str, Any]] = None,
+            window_end: Optional[datetime] = None, **kwargs) -> CachedResponse:
+        """
+        GET a URL through the cache
+
+        Fresh entries are served from disk without a request. Expired entries are
+        revalidated with a conditional GET and served from disk on 304. Other
+        successful responses are streamed through and stored as they are read.
+
+        Args:
+            session: requests session used on a miss
+            url: Request URL
+            params: Query parameters (credentials are excluded from the key)
+            window_end: End of the data window the request covers, if any
+            **kwargs: Passed to session.get (timeout, headers, ...)
+
+        Returns:
+            Response object supporting iter_content, content, json and raise_for_status
+        """
+        entry = self.lookup(url, params)
+        if entry is not None and entry['fresh']:
+            self._touch(entry['key'])
+            return CachedResponse(200, body_path=self._body_path(entry['key']))
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = session.get(url, params=params, headers=headers or None, stream=True, **kwargs)
+        key = self.make_key(url, params)
+        expires_at = self.expiry_for(window_end)
+
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            self._touch(key, expires_at=expires_at, revalidated=True)
+            logger.info(f"Revalidated cached response for {url}")
+            return CachedResponse(200, body_path=self._body_path(key))
+
+        if response.status_code != 200:
+            return CachedResponse(response.status_code, response=response)
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified') or formatdate(usegmt=True)
+        part_path = self._body_path(key).with_suffix(f".part{os.getpid()}-{threading.get_ident()}")
+
+        def commit(size: int):
+            os.replace(part_path, self._body_path(key))
+            self._store(key, url, size, etag, last_modified, expires_at)
+
+        return CachedResponse(200, response=response, part_path=part_path, on_complete=commit)
+
+    def _store(self, key: str, url: str, size: int, etag: Optional[str],
+               last_modified: Optional[str], expires_at: Optional[float]):
+        """Record a committed body in the index"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("""
+                INSERT OR REPLACE INTO responses
+                (key, url, size, etag, last_modified, fetched_at, expires_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (key, url, size, etag, last_modified, now, expires_at, now))
+        self.evict()
+
+    def _touch(self, key: str, expires_at: Optional[float] = None, revalidated: bool = False):
+        """Update the access time (and the expiry after a revalidation) of an entry"""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                if revalidated:
+                    conn.execute("UPDATE responses SET last_access = ?, expires_at = ? WHERE key = ?",
+                                 (time.time(), expires_at, key))
+                else:
+                    conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+
+    def evict(self):
+        """Evict least recently used responses until the cache fits in max_bytes"""
+        with self._lock:
+            conn = self._connect()
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+
+            evicted = 0
+            with conn:
+                for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._body_path(key).unlink(missing_ok=True)
+                    total -= size
+                    evicted += 1
+
+        logger.info(f"Evicted {evicted} responses from response cache ({total} bytes cached)")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Regression checks for RecordDeduplicator
+Distinct facts must survive deduplication; only repeated boilerplate collapses
+"""
+
+from pathlib import Path
+
+from grid_document_analyzer import GridDocumentAnalyzer, RecordDeduplicator
+
+PLACES = ['Olkiluoto', 'Forssa', 'Hikiä', 'Rauma', 'Pori', 'Ulvila', 'Huittinen',
+          'Alajärvi', 'Seinäjoki', 'Kristinestad', 'Vaasa', 'Petäjävesi']
+
+def location(page: int) -> str:
+    """Record location as passed by the analyzer (document and page)"""
+    return f"plan.pdf\0{page}"
+
+def test_place_names_are_distinct_records():
+    deduplicator = RecordDeduplicator()
+    results = [
+        deduplicator.add('connection', f"The customer applies for a new connection point at {place} substation "
+                                       f"and the grid connection study is prepared within three months.",
+                         location(page))
+        for page, place in enumerate(PLACES)
+    ]
+    assert not any(repeated for _, repeated in results)
+    assert len({record_id for record_id, _ in results}) == len(PLACES)
+
+def test_polarity_and_direction_are_distinct_records():
+    deduplicator = RecordDeduplicator()
+    sentences = [
+        "The connection offer must be submitted before the customer signs the connection agreement.",
+        "The connection offer must be submitted after the customer signs the connection agreement.",
+        "Connection from Finland to Sweden is limited by the available transfer capacity in winter.",
+        "Connection from Sweden to Finland is limited by the available transfer capacity in winter."
+    ]
+    assert [deduplicator.add('connection', sentence)[1] for sentence in sentences] == [False] * 4
+
+def test_repeated_footer_collapses():
+    deduplicator = RecordDeduplicator()
+    footer = "Copyright Fingrid Oyj, the connection agreement template is subject to change page {}."
+    record_id, repeated = deduplicator.add('connection', footer.format(12), location(12))
+    assert not repeated
+    assert deduplicator.add('connection', footer.format(13), location(13)) == (record_id, True)
+
+def test_sentence_returning_after_eviction_gets_new_id():
+    deduplicator = RecordDeduplicator(max_entries=2)
+    sentence = "Congestion on the Pori - Rauma line is a constraint for new connections."
+    first_id, _ = deduplicator.add('constraint', sentence, location(1))
+    for page in range(2, 5):
+        deduplicator.add('constraint', f"Constraint {'on line ' * page}limits capacity.", location(page))
+    second_id, repeated = deduplicator.add('constraint', sentence, location(9))
+    assert not repeated
+    assert second_id != first_id
+
+def test_analysis_repeats_merge_into_occurrences(tmp_path):
+    analyzer = GridDocumentAnalyzer(str(tmp_path))
+    deduplicator = RecordDeduplicator()
+    canonical_records = {}
+    header = "Fingrid Oyj main grid development plan and the grid connection terms apply to all customers"
+    
+    analyses = []
+    for file_name, place, pages in (('plan_2022.pdf', 'Pori', (0, 1)), ('plan_2024.pdf', 'Rauma', (0,))):
+        analysis = analyzer._empty_analysis(Path(file_name))
+        for page in pages:
+            analysis['connection_info'].append({'page': page, 'text': header, 'type': 'connection'})
+        analysis['connection_info'].append({'page': 5, 'text': f"A new connection point at {place} substation",
+                                            'type': 'connection'})
+        analyzer._deduplicate_analysis(analysis, deduplicator, canonical_records)
+        analyses.append(analysis)
+    
+    first, second = analyses
+    assert [item['text'] for item in first['connection_info']] == [header, "A new connection point at Pori substation"]
+    assert first['connection_info'][0]['occurrences'] == [['plan_2022.pdf', 0], ['plan_2022.pdf', 1],
+                                                          ['plan_2024.pdf', 0]]
+    assert [item['text'] for item in second['connection_info']] == ["A new connection point at Rauma substation"]
+    assert (first['duplicate_points'], second['duplicate_points']) == (1, 1)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Time Series Store for grid data
+Local columnar store of fetched ENTSO-E and Fingrid time series, partitioned
+by border/zone and month as Parquet files
+"""
+
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional
+from urllib.parse import quote, unquote
+import pandas as pd
+import logging
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = ds = pq = None
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Datasets held by the store: the column used for month partitioning and range
+# reads, and the columns that identify a record within a zone (upsert key)
+TABLES = {
+    'capacity': {
+        'time_column': 'timestamp',
+        'key_columns': ('from_domain', 'to_domain', 'curve_type', 'timestamp')
+    },
+    'flows': {
+        'time_column': 'timestamp',
+        'key_columns': ('timestamp',)
+    },
+    'unavailability': {
+        'time_column': 'start_time',
+        'key_columns': ('asset_name', 'asset_type', 'start_time', 'end_time')
+    },
+    'installed_capacity': {
+        'time_column': None,
+        'key_columns': ('fuel_type', 'year')
+    }
+}
+
+# Partition columns, encoded in the directory names rather than in the files
+PARTITION_COLUMNS = ('zone', 'month')
+
+def utc_timestamp(value: Optional[datetime]) -> Optional[pd.Timestamp]:
+    """Convert a datetime to a UTC timestamp (naive datetimes are taken as UTC)"""
+    if value is None:
+        return None
+    timestamp = pd.Timestamp(value)
+    return timestamp.tz_localize('UTC') if timestamp.tzinfo is None else timestamp.tz_convert('UTC')
+
+class TimeSeriesStore:
+    """
+    Parquet time series store with one table per dataset
+
+    Each table is a hive-partitioned directory (``zone=<zone>/month=<YYYY-MM>``)
+    with one sorted Parquet file per partition. Writes upsert: records whose key
+    already exists in a partition are replaced, everything else is appended.
+    Reads prune partitions by zone and month and push the remaining predicates
+    down to the Parquet row groups, e.g. the winter 2024 maximum of the
+    Finland -> Sweden capacity::
+
+        store.read('capacity', zones=['Finland-Sweden'],
+                   start=datetime(2024, 1, 1), end=datetime(2024, 3, 1))['capacity_mw'].max()
+    """
+
+    def __init__(self, root: str = "data/timeseries_store"):
+        """
+        Initialize time series store
+
+        Args:
+            root: Directory holding one subdirectory per table
+        """
+        self.root = Path(root)
+        self.available = pa is not None
+        self._lock = threading.Lock()
+
+        if not self.available:
+            logger.error("pyarrow not available - time series store is disabled")
+            logger.info("Install with: pip install pyarrow")
+
+    def _table_dir(self, table: str) -> Path:
+        return self.root / table
+
+    def _partitioning(self):
+        return ds.partitioning(pa.schema([('zone', pa.string()), ('month', pa.string())]), flavor='hive')
+
+    def _months(self, table: str, df: pd.DataFrame) -> pd.Series:
+        """Month partition of every record"""
+        time_column = TABLES[table]['time_column']
+        if time_column is None:
+            return df['year'].astype(int).map(lambda year: f"{year:04d}-01")
+        return df[time_column].dt.strftime('%Y-%m')
+
+    def write(self, table: str, df: pd.DataFrame, zone: str) -> int:
+        """
+        Upsert records of one border/zone into a table
+
+        Args:
+            table: Table name (see TABLES)
+            df: Records as returned by the API clients
+            zone: Border ("Finland-Sweden") or zone/country the records belong to
+
+        Returns:
+            Number of records written
+        """
+        if not self.available or df.empty:
+            return 0
+        if table not in TABLES:
+            logger.error(f"Unknown time series table '{table}', use one of {list(TABLES)}")
+            return 0
+
+        time_column = TABLES[table]['time_column']
+        df = df.drop(columns=[column for column in PARTITION_COLUMNS if column in df.columns])
+        if time_column is not None:
+            df[time_column] = pd.to_datetime(df[time_column], utc=True)
+            df = df[df[time_column].notna()]
+        key_columns = [column for column in TABLES[table]['key_columns'] if column in df.columns]
+
+        zone_dir = self._table_dir(table) / f"zone={quote(zone, safe='')}"
+        written = 0
+        with self._lock:
+            for month, records in df.groupby(self._months(table, df), sort=True):
+                path = zone_dir / f"month={month}" / 'part-0.parquet'
+                if path.exists():
+                    records = pd.concat([pq.read_table(path).to_pandas(), records], ignore_index=True)
+                if key_columns:
+                    records = records.drop_duplicates(subset=key_columns, keep='last')
+                if time_column is not None:
+                    records = records.sort_values(time_column, kind='stable')
+
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+                arrow_table = pa.Table.from_pandas(records, preserve_index=False)
+                if time_column is not None:
+                    # One timestamp unit across files, whatever resolution pandas inferred
+                    arrow_table = arrow_table.set_column(
+                        arrow_table.schema.get_field_index(time_column), time_column,
+                        arrow_table[time_column].cast(pa.timestamp('us', tz='UTC'))
+                    )
+                pq.write_table(arrow_table, tmp_path)
+                os.replace(tmp_path, path)
+                written += len(records)
+
+        logger.info(f"Stored {len(df)} {table} records for {zone}")
+        return written
+
+    def zones(self, table: str) -> List[str]:
+        """List the borders/zones stored in a table"""
+        return sorted(unquote(path.name[len('zone='):]) for path in self._table_dir(table).glob('zone=*'))
+
+    def read(self, table: str, zones: Optional[List[str]] = None, start: Optional[datetime] = None,
+             end: Optional[datetime] = None, columns: Optional[List[str]] = None,
+             filter: Optional[Any] = None) -> pd.DataFrame:
+        """
+        Read records from a table
+
+        Only the partition files of the requested zones and months are opened,
+        and the time range and ``filter`` are evaluated against Parquet row group
+        statistics before any data is decoded.
+
+        Args:
+            table: Table name (see TABLES)
+            zones: Borders/zones to read (all when None)
+            start: Start of the time range (inclusive, naive times are UTC)
+            end: End of the time range (exclusive, naive times are UTC)
+            columns: Columns to read (all when None)
+            filter: Additional pyarrow.dataset expression, e.g. ds.field('curve_type') == 'A01'
+
+        Returns:
+            DataFrame with the matching records and their zone and month
+        """
+        if not self.available or table not in TABLES:
+            return pd.DataFrame()
+
+        time_column = TABLES[table]['time_column']
+        start = utc_timestamp(start)
+        end = utc_timestamp(end)
+        last = end - pd.Timedelta(microseconds=1) if end is not None else None
+
+        # Partition pruning: zone directories, then month directories within the range
+        if time_column is None:
+            first_month = f"{start.year:04d}-01" if start is not None else None
+            last_month = f"{last.year:04d}-01" if last is not None else None
+        else:
+            first_month = start.strftime('%Y-%m') if start is not None else None
+            last_month = last.strftime('%Y-%m') if last is not None else None
+
+        table_dir = self._table_dir(table)
+        if zones is None:
+            zone_dirs = sorted(table_dir.glob('zone=*'))
+        else:
+            zone_dirs = [table_dir / f"zone={quote(zone, safe='')}" for zone in zones]
+
+        files = []
+        for zone_dir in zone_dirs:
+            for month_dir in sorted(zone_dir.glob('month=*')):
+                month = month_dir.name[len('month='):]
+                if (first_month and month < first_month) or (last_month and month > last_month):
+                    continue
+                path = month_dir / 'part-0.parquet'
+                if path.exists():
+                    files.append(str(path))
+
+        if not files:
+            return pd.DataFrame(columns=columns) if columns else pd.DataFrame()
+
+        partitioning = self._partitioning()
+        schema = pa.unify_schemas([pq.read_schema(path) for path in files] + [partitioning.schema])
+        dataset = ds.dataset(files, schema=schema, format='parquet', partitioning=partitioning,
+                             partition_base_dir=str(table_dir))
+
+        # Predicate pushdown: time range and caller filter are applied per row group
+        expression = filter
+        conditions = []
+        if time_column is None:
+            if start is not None:
+                conditions.append(ds.field('year') >= start.year)
+            if last is not None:
+                conditions.append(ds.field('year') <= last.year)
+        else:
+            time_type = schema.field(time_column).type
+            if start is not None:
+                conditions.append(ds.field(time_column) >= pa.scalar(start.to_pydatetime(), type=time_type))
+            if end is not None:
+                conditions.append(ds.field(time_column) < pa.scalar(end.to_pydatetime(), type=time_type))
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+
+        return dataset.to_table(columns=columns, filter=expression).to_pandas()
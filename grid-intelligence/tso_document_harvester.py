@@ -6,38 +6,421 @@ to extract connection queue and capacity allocation information
 """
 
 import requests
+import hashlib
 import os
 import json
+import threading
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from urllib.parse import urljoin, urlparse
+from email.utils import formatdate
+from typing import Dict, List, Optional, Any, Callable, Iterable, Iterator, Tuple, Union
+from urllib.parse import urldefrag, urljoin, urlparse
 import re
 from pathlib import Path
 import logging
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import PyPDF2
 import pdfplumber
 
+from page_text_cache import PageTextCache
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Politeness delays after each request to a TSO host (seconds)
+PAGE_SCAN_DELAY = 2.0
+DOCUMENT_DELAY = 3.0
+
+# Bytes read from a document download per write
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Newly extracted pages written to the page text cache per transaction
+CACHE_FLUSH_PAGES = 32
+
+# lxml parses pages much faster than the pure-Python parser; use it when installed
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Links the crawl frontier follows: HTML pages, not downloads or media
+PAGE_LINK_PATTERN = re.compile(r'(?:/|/[^/.]*|\.html?|\.aspx?|\.php|\.jsp)$', re.IGNORECASE)
+
+class HostThrottle:
+    """
+    Per-host request serialization shared by all harvest lanes
+
+    Requests to the same host run one at a time, and each starts at least
+    ``delay`` seconds after the previous one to that host completed.
+    Requests to different hosts do not wait for each other.
+    """
+
+    def __init__(self):
+        """Initialize host throttle"""
+        self._lock = threading.Lock()
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._next_request: Dict[str, float] = {}
+
+    @contextmanager
+    def request(self, url: str, delay: float):
+        """
+        Hold the host of ``url`` for the duration of one request
+        
+        Args:
+            url: Request URL
+            delay: Minimum pause after this request before the host's next one
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            host_lock = self._host_locks.setdefault(host, threading.Lock())
+        
+        with host_lock:
+            wait = self._next_request.get(host, 0.0) - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                yield
+            finally:
+                self._next_request[host] = time.monotonic() + delay
+
+class PdfPatternMatcher:
+    """
+    Combined matcher for a TSO's document filename patterns
+
+    Matches like ``any(re.match(p, filename, re.IGNORECASE) for p in patterns)``.
+    Patterns made of literal fragments joined by ``.*`` (the usual
+    ``.*development.*plan.*\\.pdf`` form) become a chain of ``str.find`` calls,
+    which cannot backtrack; any other pattern is folded into one compiled
+    regular expression.
+    """
+
+    def __init__(self, patterns: List[str]):
+        """
+        Initialize pattern matcher
+
+        Args:
+            patterns: Regular expressions matched at the start of a filename
+        """
+        self.patterns = tuple(patterns)
+        self._fragment_chains = []
+        regex_patterns = []
+        for pattern in patterns:
+            chain = self._fragment_chain(pattern)
+            if chain is None:
+                regex_patterns.append(f"(?:{pattern})")
+            else:
+                self._fragment_chains.append(chain)
+
+        self._regex = re.compile('|'.join(regex_patterns), re.IGNORECASE) if regex_patterns else None
+
+    @staticmethod
+    def _fragment_chain(pattern: str) -> Optional[Tuple[bool, Tuple[str, ...], bool]]:
+        """
+        Split a pattern into (anchored at start, lowercase literal fragments, anchored at end)
+
+        Returns None for patterns that are not literal fragments joined by ``.*``.
+        """
+        anchored_end = pattern.endswith('$') and not pattern.endswith('\\$')
+        body = pattern[1:] if pattern.startswith('^') else pattern
+        body = body[:-1] if anchored_end else body
+
+        fragments = []
+        for piece in body.split('.*'):
+            literal = []
+            chars = iter(piece)
+            for char in chars:
+                if char == '\\':
+                    escaped = next(chars, None)
+                    if escaped is None or escaped.isalnum():
+                        return None
+                    literal.append(escaped)
+                elif char in '.^$*+?{}[]|()':
+                    return None
+                else:
+                    literal.append(char)
+            fragments.append(''.join(literal).lower())
+
+        anchored_start = fragments[0] != ''
+        return anchored_start, tuple(fragment for fragment in fragments if fragment), anchored_end
+
+    def match(self, filename: str) -> bool:
+        """Check whether a filename matches any of the patterns"""
+        lowered = filename.lower()
+        for anchored_start, fragments, anchored_end in self._fragment_chains:
+            if self._match_chain(lowered, anchored_start, fragments, anchored_end):
+                return True
+        return self._regex is not None and self._regex.match(filename) is not None
+
+    @staticmethod
+    def _match_chain(text: str, anchored_start: bool, fragments: Tuple[str, ...], anchored_end: bool) -> bool:
+        """Find the fragments in order; leftmost occurrences leave the most room for the rest"""
+        if not fragments:
+            return not (anchored_start or anchored_end) or text == ''
+        
+        position = 0
+        last = len(fragments) - 1
+        for index, fragment in enumerate(fragments):
+            if index == 0 and anchored_start:
+                if not text.startswith(fragment):
+                    return False
+                found = 0
+            elif index == last and anchored_end:
+                found = len(text) - len(fragment)
+                if found < position or not text.endswith(fragment):
+                    return False
+            else:
+                found = text.find(fragment, position)
+                if found < 0:
+                    return False
+            position = found + len(fragment)
+        return not anchored_end or position == len(text)
+
+# Connection process phrases counted in every TSO document
+CONNECTION_TERMS = [
+    'connection request', 'connection application', 'grid connection',
+    'transmission connection', 'connection process', 'connection agreement',
+    'connection queue', 'connection capacity', 'available capacity'
+]
+
+# Capacity values (MW, GW) and project timelines, matched on lowercased text
+CAPACITY_PATTERN = r'(\d+(?:\.\d+)?)\s*(mw|gw|megawatt|gigawatt)'
+TIMELINE_PATTERN = r'(202[0-9]|20[3-9][0-9])\s*[-–]\s*(202[0-9]|20[3-9][0-9])'
+
+# Trailing text that may still become a capacity or timeline match when the next page arrives
+PENDING_MATCH_TAIL = re.compile(r'(?:\d+(?:\.\d+)?|(?:202[0-9]|20[3-9][0-9])\s*[-–])\s*\Z')
+PENDING_TAIL_WINDOW = 4096
+PENDING_TAIL_ENDINGS = set('0123456789-–')
+
+class QueueContentScanner:
+    """
+    Streaming counter of queue keywords, connection terms, capacity values and timelines
+    
+    The text is consumed piece by piece (typically page by page) and never
+    joined into one string. Each piece is lowercased once; every term is then
+    counted with its own ``str.count`` pass over the piece, and the capacity
+    and timeline patterns take one ``finditer`` pass each, all while the piece
+    is still hot in the CPU cache (a combined regex over all terms measured
+    slower than the per-term substring searches). Counts equal separate
+    ``str.count`` / ``re.findall`` passes over the whole text: terms never span
+    lines, and a number that may still grow into a capacity or timeline match
+    is carried over to the next piece.
+    """
+
+    def __init__(self, keywords: List[str], connection_terms: List[str] = CONNECTION_TERMS):
+        """
+        Initialize scanner
+        
+        Args:
+            keywords: Queue keywords of a TSO (matched case-insensitively)
+            connection_terms: Connection process phrases (lowercase)
+        """
+        self.terms = sorted({term.lower() for term in list(keywords) + list(connection_terms) if term})
+        self._capacity_pattern = re.compile(CAPACITY_PATTERN)
+        self._timeline_pattern = re.compile(TIMELINE_PATTERN)
+
+    def scan(self, text: Union[str, Iterable[str]]) -> Dict[str, Any]:
+        """
+        Count all terms and collect capacity values and timelines, piece by piece
+        
+        Args:
+            text: Document text, or an iterable of consecutive text pieces (pages)
+                that is consumed once and never joined into one string
+                
+        Returns:
+            Dictionary with 'term_counts', 'capacity_mentions', 'capacities' (first
+            10 as (value, unit)), 'timeline_mentions', 'timelines' (first 5 as
+            (start, end)) and 'text_length'
+        """
+        term_counts = dict.fromkeys(self.terms, 0)
+        result = {
+            'term_counts': term_counts,
+            'capacity_mentions': 0,
+            'capacities': [],
+            'timeline_mentions': 0,
+            'timelines': [],
+            'text_length': 0
+        }
+        
+        chunks = iter((text,) if isinstance(text, str) else text)
+        pending = ''
+        # Length of the start of ``pending`` whose terms have already been counted
+        terms_done = 0
+        capacity_next = timeline_next = 0
+        while True:
+            chunk = next(chunks, None)
+            if chunk is None:
+                buffer = pending
+                term_cut = match_cut = len(buffer)
+            else:
+                result['text_length'] += len(chunk)
+                buffer = pending + chunk.lower()
+                # Terms never span lines; numbers followed only by whitespace wait for the next piece
+                term_cut = match_cut = max(buffer.rfind('\n') + 1, terms_done)
+                window_start = max(0, match_cut - PENDING_TAIL_WINDOW)
+                if buffer[window_start:match_cut].rstrip()[-1:] in PENDING_TAIL_ENDINGS:
+                    tail = PENDING_MATCH_TAIL.search(buffer, window_start, match_cut)
+                    if tail:
+                        match_cut = tail.start()
+            
+            if term_cut > terms_done:
+                lines = buffer[terms_done:term_cut]
+                for term in self.terms:
+                    term_counts[term] += lines.count(term)
+            
+            # Matches starting before the cut are complete; each kind resumes after its last match
+            for match in self._capacity_pattern.finditer(buffer, capacity_next):
+                if match.start() >= match_cut:
+                    break
+                result['capacity_mentions'] += 1
+                capacity_next = match.end()
+                if len(result['capacities']) < 10:
+                    result['capacities'].append(match.groups())
+            
+            for match in self._timeline_pattern.finditer(buffer, timeline_next):
+                if match.start() >= match_cut:
+                    break
+                result['timeline_mentions'] += 1
+                timeline_next = match.end()
+                if len(result['timelines']) < 5:
+                    result['timelines'].append(match.groups())
+            
+            if chunk is None:
+                return result
+            
+            # Carry the unscanned rest to the front of the next piece
+            pending = buffer[match_cut:]
+            terms_done = term_cut - match_cut
+            capacity_next = max(capacity_next - match_cut, 0)
+            timeline_next = max(timeline_next - match_cut, 0)
+
+def _cached_page_text(text_cache: Optional[PageTextCache], digest: Optional[str], page_index: int,
+                      extract: Callable[[], Optional[str]], extracted: Dict[int, Optional[str]],
+                      extractor: str) -> Optional[str]:
+    """Get one page's text from the text cache, or extract it and queue it in ``extracted`` for caching"""
+    if text_cache is not None:
+        cached, text = text_cache.get_page(digest, page_index, extractor)
+        if cached:
+            return text
+    
+    text = extract()
+    if text_cache is not None:
+        extracted[page_index] = text
+    return text
+
+def iter_pdf_pages(pdf_path: str, text_cache: Optional[PageTextCache] = None) -> Iterator[str]:
+    """
+    Yield the text of a PDF one page at a time
+    
+    Pages come from the text cache when present, otherwise from pdfplumber;
+    only pages on which pdfplumber finds no text are re-extracted with PyPDF2.
+    Newly extracted pages are written to the cache every CACHE_FLUSH_PAGES
+    pages and when the document ends, and every page is released once the
+    consumer moves on, so memory is bounded by a few pages, not the document.
+    
+    Args:
+        pdf_path: Path to PDF file
+        text_cache: Optional page text cache
+        
+    Yields:
+        Text of every page that has any, in page order
+    """
+    digest = text_cache.file_digest(pdf_path) if text_cache is not None else None
+    page_count = text_cache.get_page_count(digest) if text_cache is not None else None
+    if page_count is not None:
+        text_cache.touch(digest)
+    
+    with ExitStack() as stack:
+        # Extractors are only opened once a page is missing from the cache
+        opened: Dict[str, Any] = {}
+        
+        def plumber_pages():
+            if 'pdfplumber' not in opened:
+                opened['pdfplumber'] = stack.enter_context(pdfplumber.open(pdf_path)).pages
+            return opened['pdfplumber']
+        
+        def extract_pdfplumber() -> str:
+            page = plumber_pages()[page_index]
+            text = page.extract_text() or ''
+            # Release the page's parsed layout objects before the next page
+            page.flush_cache()
+            return text
+        
+        def extract_pypdf2() -> Optional[str]:
+            if 'pypdf2' not in opened:
+                opened['pypdf2'] = PyPDF2.PdfReader(stack.enter_context(open(pdf_path, 'rb')))
+            try:
+                return opened['pypdf2'].pages[page_index].extract_text()
+            except Exception as e:
+                logger.warning(f"Error extracting text from page: {e}")
+                return None
+        
+        if page_count is None:
+            page_count = len(plumber_pages())
+        
+        # Pages extracted since the last cache write, per extractor
+        extracted: Dict[str, Dict[int, Optional[str]]] = {'pdfplumber': {}, 'pypdf2': {}}
+        
+        def flush():
+            for extractor, pages in extracted.items():
+                text_cache.put_pages(digest, page_count, pages, extractor)
+                pages.clear()
+        
+        try:
+            for page_index in range(page_count):
+                text = _cached_page_text(text_cache, digest, page_index, extract_pdfplumber,
+                                         extracted['pdfplumber'], 'pdfplumber')
+                if not text or not text.strip():
+                    text = _cached_page_text(text_cache, digest, page_index, extract_pypdf2,
+                                             extracted['pypdf2'], 'pypdf2')
+                
+                if text_cache is not None and len(extracted['pdfplumber']) >= CACHE_FLUSH_PAGES:
+                    flush()
+                
+                if text:
+                    yield text
+        finally:
+            if text_cache is not None:
+                flush()
+
+def _scan_pdf(pdf_path: str, scanner: QueueContentScanner,
+              text_cache: Optional[PageTextCache] = None) -> Dict[str, Any]:
+    """Stream a PDF's pages through a scanner (in a lane thread or an extraction worker)"""
+    return scanner.scan(text + "\n" for text in iter_pdf_pages(pdf_path, text_cache))
+
 class TSODocumentHarvester:
     """
     Automated harvester for TSO planning documents across European countries
     Focus on extracting grid connection queue and capacity information
     """
     
-    def __init__(self, output_dir: str = "data/tso_documents"):
+    def __init__(self, output_dir: str = "data/tso_documents",
+                 text_cache: Optional[PageTextCache] = None, workers: int = 1,
+                 crawl_depth: int = 0):
         """
         Initialize document harvester
         
         Args:
             output_dir: Directory to store harvested documents
+            text_cache: Optional page text cache; unchanged PDFs are then not re-extracted
+            workers: Number of processes for PDF text extraction in harvest_all_countries
+            crawl_depth: Levels of same-host links followed from the configured pages
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.text_cache = text_cache
+        self.workers = workers
+        self.host_throttle = HostThrottle()
+        self._extract_pool = None
+        self._local = threading.local()
+        self.crawl_depth = crawl_depth
+        self.crawl_state_path = self.output_dir / 'crawl_state.json'
+        self._crawl_state = None
+        self._crawl_lock = threading.Lock()
         
         # TSO websites and document patterns for each country
         self.tso_sources = {
@@ -155,23 +538,48 @@ class TSODocumentHarvester:
             }
         }
         
-        # Session with reasonable headers
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Keyword scanners per country, built on first analysis
+        self._queue_scanners: Dict[str, QueueContentScanner] = {}
+        
+        # Each country's filename patterns compiled into one matcher
+        self.pdf_matchers = {
+            country: PdfPatternMatcher(tso_info['pdf_patterns'])
+            for country, tso_info in self.tso_sources.items()
+        }
+        
+        # Reasonable headers for every lane's session
+        self.session_headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
             'Accept-Encoding': 'gzip, deflate, br',
             'DNT': '1',
             'Connection': 'keep-alive'
-        })
+        }
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session of the calling thread (sessions are not shared across lanes)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.session_headers)
+            self._local.session = session
+        return session
 
-    def discover_documents(self, country: str) -> List[Dict[str, str]]:
+    def discover_documents(self, country: str, max_depth: Optional[int] = None) -> List[Dict[str, str]]:
         """
         Discover PDF documents from TSO websites for a specific country
         
+        Crawls outward from the configured document pages, following links on the
+        same host up to ``max_depth`` levels. Pages whose content has not changed
+        since the last crawl are not parsed again; their documents and links come
+        from the persisted crawl state.
+        
         Args:
             country: Country name (Finland, Sweden, etc.)
+            max_depth: Link depth to follow (crawl_depth by default; 0 scans only
+                the configured pages)
             
         Returns:
             List of discovered documents with metadata
@@ -181,62 +589,157 @@ class TSODocumentHarvester:
             return []
         
         tso_info = self.tso_sources[country]
+        max_depth = self.crawl_depth if max_depth is None else max_depth
+        hosts = {urlparse(url).netloc for url in tso_info['document_urls']}
         discovered_docs = []
         
         logger.info(f"Discovering documents for {country} ({tso_info['name']})")
         
-        for base_url in tso_info['document_urls']:
-            try:
-                logger.info(f"Scanning: {base_url}")
-                
-                response = self.session.get(base_url, timeout=30)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find all links
-                links = soup.find_all('a', href=True)
-                
-                for link in links:
-                    href = link['href']
-                    
-                    # Convert relative URLs to absolute
-                    full_url = urljoin(base_url, href)
-                    
-                    # Check if it's a PDF
-                    if full_url.lower().endswith('.pdf'):
-                        # Check if it matches our patterns
-                        filename = os.path.basename(urlparse(full_url).path)
-                        
-                        for pattern in tso_info['pdf_patterns']:
-                            if re.match(pattern, filename, re.IGNORECASE):
-                                doc_info = {
-                                    'country': country,
-                                    'tso': tso_info['name'],
-                                    'url': full_url,
-                                    'filename': filename,
-                                    'source_page': base_url,
-                                    'link_text': link.get_text(strip=True)[:100],
-                                    'discovered_at': datetime.now().isoformat()
-                                }
-                                
-                                discovered_docs.append(doc_info)
-                                logger.info(f"Found document: {filename}")
-                                break
-                
-                # Rate limiting
-                time.sleep(2)
-                
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Error scanning {base_url}: {e}")
-                continue
-            except Exception as e:
-                logger.error(f"Unexpected error scanning {base_url}: {e}")
+        # Breadth-first frontier of (page URL, depth); every URL is visited once
+        frontier = deque((url, 0) for url in tso_info['document_urls'])
+        seen_urls = set(tso_info['document_urls'])
+        while frontier:
+            page_url, depth = frontier.popleft()
+            page = self._scan_page(page_url, country, tso_info)
+            if page is None:
                 continue
+            
+            for doc_info in page['documents']:
+                if doc_info['url'] not in seen_urls:
+                    seen_urls.add(doc_info['url'])
+                    discovered_docs.append(doc_info)
+            
+            if depth < max_depth:
+                for link in page['links']:
+                    if link not in seen_urls and urlparse(link).netloc in hosts:
+                        seen_urls.add(link)
+                        frontier.append((link, depth + 1))
+        
+        self._save_crawl_state()
         
         logger.info(f"Discovered {len(discovered_docs)} documents for {country}")
         return discovered_docs
 
+    def _scan_page(self, page_url: str, country: str, tso_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a page and get its document and page links
+        
+        Args:
+            page_url: Page to scan
+            country: Country name
+            tso_info: TSO source configuration
+            
+        Returns:
+            Crawl state entry with 'documents' and 'links', or None if the page failed
+        """
+        crawl_pages = self._crawl_pages()
+        previous = crawl_pages.get(page_url)
+        if previous and previous.get('pdf_patterns') != tso_info['pdf_patterns']:
+            previous = None
+        
+        headers = {'If-None-Match': previous['etag']} if previous and previous.get('etag') else None
+        
+        try:
+            logger.info(f"Scanning: {page_url}")
+            
+            with self.host_throttle.request(page_url, PAGE_SCAN_DELAY):
+                response = self.session.get(page_url, headers=headers, timeout=30)
+            
+            if response.status_code == 304 and previous:
+                page = previous
+            else:
+                response.raise_for_status()
+                content_hash = hashlib.sha256(response.content).hexdigest()
+                if previous and previous['content_hash'] == content_hash:
+                    page = previous
+                else:
+                    page = self._parse_page(page_url, response.content, country, tso_info)
+                    page['content_hash'] = content_hash
+                    page['etag'] = response.headers.get('etag')
+                    page['pdf_patterns'] = tso_info['pdf_patterns']
+            
+            if page is previous:
+                logger.info(f"Page unchanged since last crawl: {page_url}")
+            
+            page['crawled_at'] = datetime.now().isoformat()
+            with self._crawl_lock:
+                crawl_pages[page_url] = page
+            return page
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error scanning {page_url}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error scanning {page_url}: {e}")
+            return None
+
+    def _parse_page(self, page_url: str, content: bytes, country: str,
+                    tso_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse the links of a page into matching documents and crawlable pages
+        
+        Args:
+            page_url: URL the page was fetched from
+            content: Page HTML
+            country: Country name
+            tso_info: TSO source configuration
+            
+        Returns:
+            Dictionary with 'documents' (document information) and 'links' (page URLs)
+        """
+        # Only anchors are needed, so the parser builds no tree for the rest of the page
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=SoupStrainer('a', href=True))
+        
+        documents = []
+        links = []
+        for link in soup.find_all('a', href=True):
+            # Convert relative URLs to absolute
+            full_url = urldefrag(urljoin(page_url, link['href'])).url
+            parsed = urlparse(full_url)
+            
+            # Check if it's a PDF
+            if parsed.path.lower().endswith('.pdf'):
+                # Check if it matches our patterns
+                filename = os.path.basename(parsed.path)
+                
+                if self.pdf_matchers[country].match(filename):
+                    documents.append({
+                        'country': country,
+                        'tso': tso_info['name'],
+                        'url': full_url,
+                        'filename': filename,
+                        'source_page': page_url,
+                        'link_text': link.get_text(strip=True)[:100],
+                        'discovered_at': datetime.now().isoformat()
+                    })
+                    logger.info(f"Found document: {filename}")
+            elif parsed.scheme in ('http', 'https') and PAGE_LINK_PATTERN.search(parsed.path):
+                links.append(full_url)
+        
+        return {'documents': documents, 'links': links}
+
+    def _crawl_pages(self) -> Dict[str, Dict[str, Any]]:
+        """Crawl state of every scanned page, loaded from disk on first use"""
+        with self._crawl_lock:
+            if self._crawl_state is None:
+                try:
+                    with open(self.crawl_state_path, 'r', encoding='utf-8') as f:
+                        self._crawl_state = json.load(f)
+                except (OSError, ValueError):
+                    self._crawl_state = {'pages': {}}
+            return self._crawl_state['pages']
+
+    def _save_crawl_state(self):
+        """Persist the crawl state (atomically, as lanes may save concurrently)"""
+        with self._crawl_lock:
+            if self._crawl_state is None:
+                return
+            data = json.dumps(self._crawl_state, indent=2, ensure_ascii=False)
+            tmp_path = self.crawl_state_path.with_suffix(f".tmp{threading.get_ident()}")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.crawl_state_path)
+
     def download_document(self, doc_info: Dict[str, str]) -> Optional[str]:
         """
         Download a document and save it locally
@@ -255,30 +758,38 @@ class TSODocumentHarvester:
             safe_filename = re.sub(r'[^\w\-_\.]', '_', doc_info['filename'])
             local_path = country_dir / safe_filename
             
-            # Skip if already exists
-            if local_path.exists():
+            part_path = local_path.with_name(local_path.name + '.part')
+            headers = self._download_headers(local_path, part_path)
+            if headers is None:
                 logger.info(f"Document already exists: {local_path}")
                 return str(local_path)
             
             logger.info(f"Downloading: {doc_info['url']}")
             
-            response = self.session.get(doc_info['url'], stream=True, timeout=60)
-            response.raise_for_status()
+            # Byte ranges and Content-Length refer to the encoded body; ask for
+            # the file as stored so both match the bytes written to disk
+            headers['Accept-Encoding'] = 'identity'
             
-            # Check if it's actually a PDF
-            content_type = response.headers.get('content-type', '').lower()
-            if 'pdf' not in content_type:
-                # Check first few bytes for PDF signature
-                first_bytes = response.content[:10]
-                if not first_bytes.startswith(b'%PDF'):
-                    logger.warning(f"URL does not return PDF content: {doc_info['url']}")
-                    return None
+            with self.host_throttle.request(doc_info['url'], DOCUMENT_DELAY):
+                with self.session.get(doc_info['url'], headers=headers, stream=True, timeout=60) as response:
+                    if response.status_code == 304:
+                        logger.info(f"Document unchanged: {local_path}")
+                        return str(local_path)
+                    if response.status_code == 416:
+                        # Partial file no longer matches the document; start over next time
+                        part_path.unlink(missing_ok=True)
+                        self._meta_path(part_path).unlink(missing_ok=True)
+                        logger.warning(f"Cannot resume {doc_info['url']}; will restart on the next harvest")
+                        return str(local_path) if local_path.exists() else None
+                    response.raise_for_status()
+                    
+                    if not self._write_download(doc_info, response, part_path):
+                        # Keep serving the previous version, if any
+                        return str(local_path) if local_path.exists() else None
             
-            # Save file
-            with open(local_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            # Only complete downloads replace the previous version
+            os.replace(part_path, local_path)
+            os.replace(self._meta_path(part_path), self._meta_path(local_path))
             
             logger.info(f"Downloaded to: {local_path}")
             return str(local_path)
@@ -290,10 +801,129 @@ class TSODocumentHarvester:
             logger.error(f"Unexpected error downloading {doc_info['url']}: {e}")
             return None
 
+    def _meta_path(self, path: Path) -> Path:
+        """Sidecar file holding the HTTP validators of a downloaded (or partial) document"""
+        return path.with_name(path.name + '.meta.json')
+
+    def _read_meta(self, path: Path) -> Dict[str, Any]:
+        """Read the validators of a document ({} when unknown)"""
+        try:
+            with open(self._meta_path(path), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _download_headers(self, local_path: Path, part_path: Path) -> Optional[Dict[str, str]]:
+        """
+        Request headers for (re-)downloading a document
+        
+        Args:
+            local_path: Path of the complete document
+            part_path: Path of an interrupted download
+            
+        Returns:
+            Range headers to resume a partial download, conditional headers to
+            revalidate an existing document, {} for a fresh download, or None
+            when an existing document cannot be revalidated
+        """
+        part_meta = self._read_meta(part_path)
+        validator = part_meta.get('etag') or part_meta.get('last_modified')
+        if part_path.exists() and validator:
+            return {'Range': f"bytes={part_path.stat().st_size}-", 'If-Range': validator}
+        
+        if not local_path.exists():
+            return {}
+        
+        if not self._meta_path(local_path).exists():
+            # Downloaded before validators were recorded; fall back to the file time
+            return {'If-Modified-Since': formatdate(local_path.stat().st_mtime, usegmt=True)}
+        
+        meta = self._read_meta(local_path)
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers or None
+
+    def _write_download(self, doc_info: Dict[str, str], response: requests.Response, part_path: Path) -> bool:
+        """
+        Stream a response into the partial download file
+        
+        A 206 response is appended to the existing partial file; anything else
+        starts it over. The validators are recorded before the body is written,
+        so an interrupted download can be resumed by the next harvest.
+        
+        Args:
+            doc_info: Document information dictionary
+            response: Streamed response
+            part_path: Path of the partial download
+            
+        Returns:
+            True if the partial file now holds the complete document
+        """
+        offset = 0
+        if response.status_code == 206:
+            offset = part_path.stat().st_size
+            content_range = response.headers.get('content-range', '')
+            if not content_range.startswith(f"bytes {offset}-"):
+                logger.warning(f"Unexpected range {content_range!r} resuming {doc_info['url']}; restarting")
+                part_path.unlink(missing_ok=True)
+                self._meta_path(part_path).unlink(missing_ok=True)
+                return False
+        
+        chunks = response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+        first_chunk = next(chunks, b'')
+        
+        if offset == 0:
+            # Check if it's actually a PDF (signature in the first chunk only)
+            content_type = response.headers.get('content-type', '').lower()
+            if 'pdf' not in content_type and not first_chunk.startswith(b'%PDF'):
+                logger.warning(f"URL does not return PDF content: {doc_info['url']}")
+                return False
+            
+            meta = {
+                'url': doc_info['url'],
+                'etag': response.headers.get('etag'),
+                'last_modified': response.headers.get('last-modified'),
+                'downloaded_at': datetime.now().isoformat()
+            }
+            tmp_path = self._meta_path(part_path).with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, indent=2)
+            os.replace(tmp_path, self._meta_path(part_path))
+        else:
+            logger.info(f"Resuming download at byte {offset}: {doc_info['url']}")
+        
+        with open(part_path, 'ab' if offset else 'wb') as f:
+            f.write(first_chunk)
+            for chunk in chunks:
+                if chunk:
+                    f.write(chunk)
+        
+        content_length = response.headers.get('content-length')
+        if response.headers.get('content-encoding', 'identity').lower() != 'identity':
+            # Server compressed anyway: the length counts encoded bytes, and the
+            # decoded partial file cannot be resumed with a byte range
+            if content_length is not None and response.raw.tell() != int(content_length):
+                logger.warning(f"Incomplete download of {doc_info['url']}; will restart on the next harvest")
+                part_path.unlink(missing_ok=True)
+                self._meta_path(part_path).unlink(missing_ok=True)
+                return False
+            return True
+        
+        if content_length is not None and part_path.stat().st_size != offset + int(content_length):
+            logger.warning(f"Incomplete download of {doc_info['url']}; will resume on the next harvest")
+            return False
+        return True
+
     def extract_text_from_pdf(self, pdf_path: str) -> Optional[str]:
         """
         Extract text from PDF document
         
+        Builds the whole document text; analysis streams pages through
+        analyze_document instead.
+        
         Args:
             pdf_path: Path to PDF file
             
@@ -301,92 +931,99 @@ class TSODocumentHarvester:
             Extracted text or None if error
         """
         try:
-            # Try pdfplumber first (better for tables and complex layouts)
-            with pdfplumber.open(pdf_path) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
+            text = ''.join(page_text + "\n" for page_text in iter_pdf_pages(pdf_path, self.text_cache))
+            return text if text.strip() else None
                 
-                if text.strip():
-                    return text
+        except Exception as e:
+            logger.error(f"Error extracting text from {pdf_path}: {e}")
+            return None
+
+    def _queue_scanner(self, country: str) -> QueueContentScanner:
+        """Keyword scanner of a country, built on first use"""
+        scanner = self._queue_scanners.get(country)
+        if scanner is None:
+            keywords = self.tso_sources.get(country, {}).get('queue_keywords', [])
+            scanner = self._queue_scanners[country] = QueueContentScanner(keywords)
+        return scanner
+
+    def analyze_document(self, pdf_path: str, country: str) -> Optional[Dict[str, Any]]:
+        """
+        Analyze a PDF document page by page for grid queue and capacity information
+        
+        Pages flow from the extractor straight into the keyword scanner, so the
+        document text is never held in memory as a whole. With workers > 1 the
+        extraction and scan run in the process pool and only the counters return.
+        
+        Args:
+            pdf_path: Path to PDF file
+            country: Country name
             
-            # Fallback to PyPDF2
-            with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                text = ""
-                
-                for page in reader.pages:
-                    try:
-                        text += page.extract_text() + "\n"
-                    except Exception as e:
-                        logger.warning(f"Error extracting text from page: {e}")
-                        continue
-                
-                return text if text.strip() else None
-                
+        Returns:
+            Analysis results dictionary, or None if no text could be extracted
+        """
+        scanner = self._queue_scanner(country)
+        try:
+            if self._extract_pool is not None:
+                scan = self._extract_pool.submit(_scan_pdf, str(pdf_path), scanner, self.text_cache).result()
+            else:
+                scan = _scan_pdf(str(pdf_path), scanner, self.text_cache)
         except Exception as e:
             logger.error(f"Error extracting text from {pdf_path}: {e}")
             return None
+        
+        if not scan['text_length']:
+            return None
+        return self._queue_analysis(scan, country)
 
-    def analyze_queue_content(self, text: str, country: str) -> Dict[str, Any]:
+    def analyze_queue_content(self, text: Union[str, Iterable[str]], country: str) -> Dict[str, Any]:
         """
         Analyze document text for grid queue and capacity information
         
         Args:
-            text: Extracted document text
+            text: Extracted document text, or an iterable of its pages
             country: Country name
             
         Returns:
             Analysis results dictionary
         """
-        if not text:
+        # All counts come from a single traversal of the text
+        scan = self._queue_scanner(country).scan(text)
+        if not scan['text_length']:
             return {'queue_indicators': 0, 'capacity_mentions': 0, 'findings': []}
         
-        text_lower = text.lower()
-        tso_info = self.tso_sources.get(country, {})
-        keywords = tso_info.get('queue_keywords', [])
-        
+        return self._queue_analysis(scan, country)
+
+    def _queue_analysis(self, scan: Dict[str, Any], country: str) -> Dict[str, Any]:
+        """Turn the counters of a QueueContentScanner scan into analysis results"""
+        keywords = self.tso_sources.get(country, {}).get('queue_keywords', [])
+        term_counts = scan['term_counts']
         findings = []
         queue_indicators = 0
-        capacity_mentions = 0
         
         # Look for queue-related keywords
         for keyword in keywords:
-            count = text_lower.count(keyword.lower())
+            count = term_counts.get(keyword.lower(), 0)
             if count > 0:
                 queue_indicators += count
                 findings.append(f"Found '{keyword}': {count} mentions")
         
         # Look for specific capacity numbers (MW, GW)
-        capacity_pattern = r'(\d+(?:\.\d+)?)\s*(mw|gw|megawatt|gigawatt)'
-        capacity_matches = re.findall(capacity_pattern, text_lower)
-        capacity_mentions = len(capacity_matches)
-        
-        if capacity_matches:
-            capacities = [f"{match[0]} {match[1].upper()}" for match in capacity_matches[:10]]  # First 10
+        capacity_mentions = scan['capacity_mentions']
+        if scan['capacities']:
+            capacities = [f"{value} {unit.upper()}" for value, unit in scan['capacities']]  # First 10
             findings.append(f"Capacity values mentioned: {', '.join(capacities)}")
         
         # Look for connection-related terms
-        connection_terms = [
-            'connection request', 'connection application', 'grid connection',
-            'transmission connection', 'connection process', 'connection agreement',
-            'connection queue', 'connection capacity', 'available capacity'
-        ]
-        
         connection_mentions = 0
-        for term in connection_terms:
-            count = text_lower.count(term)
+        for term in CONNECTION_TERMS:
+            count = term_counts[term]
             if count > 0:
                 connection_mentions += count
                 findings.append(f"Connection term '{term}': {count} mentions")
         
         # Look for time-related information (project timelines)
-        timeline_pattern = r'(202[0-9]|20[3-9][0-9])\s*[-–]\s*(202[0-9]|20[3-9][0-9])'
-        timeline_matches = re.findall(timeline_pattern, text)
-        if timeline_matches:
-            timelines = [f"{match[0]}-{match[1]}" for match in timeline_matches[:5]]
+        if scan['timelines']:
+            timelines = [f"{start}-{end}" for start, end in scan['timelines']]
             findings.append(f"Project timelines: {', '.join(timelines)}")
         
         # Calculate relevance score
@@ -396,10 +1033,10 @@ class TSODocumentHarvester:
             'queue_indicators': queue_indicators,
             'capacity_mentions': capacity_mentions,
             'connection_mentions': connection_mentions,
-            'timeline_mentions': len(timeline_matches),
+            'timeline_mentions': scan['timeline_mentions'],
             'relevance_score': relevance_score,
             'findings': findings,
-            'text_length': len(text),
+            'text_length': scan['text_length'],
             'analysis_timestamp': datetime.now().isoformat()
         }
 
@@ -450,12 +1087,10 @@ class TSODocumentHarvester:
                 if local_path:
                     harvest_results['documents_downloaded'] += 1
                     
-                    # Extract text
-                    text = self.extract_text_from_pdf(local_path)
+                    # Extract and analyze text page by page
+                    analysis = self.analyze_document(local_path, country)
                     
-                    if text:
-                        # Analyze content
-                        analysis = self.analyze_queue_content(text, country)
+                    if analysis:
                         doc_result['analysis'] = analysis
                         harvest_results['documents_analyzed'] += 1
                         harvest_results['total_relevance_score'] += analysis['relevance_score']
@@ -466,9 +1101,6 @@ class TSODocumentHarvester:
                 harvest_results['documents'].append(doc_result)
                 harvest_results['documents_processed'] += 1
                 
-                # Rate limiting
-                time.sleep(3)
-                
             except Exception as e:
                 logger.error(f"Error processing document {doc_info['filename']}: {e}")
                 continue
@@ -491,6 +1123,10 @@ class TSODocumentHarvester:
         """
         Harvest documents for all configured countries
         
+        Each TSO host is harvested in its own lane (thread), so the harvest takes
+        about as long as the slowest TSO. Requests to a host keep their politeness
+        delays; with workers > 1 PDF text extraction runs in a process pool.
+        
         Returns:
             Complete harvest results for all countries
         """
@@ -509,13 +1145,29 @@ class TSODocumentHarvester:
             }
         }
         
+        # One lane per TSO host; countries sharing a host run in the same lane
+        lanes: Dict[str, List[str]] = {}
+        for country, tso_info in self.tso_sources.items():
+            lanes.setdefault(urlparse(tso_info['base_url']).netloc, []).append(country)
+        
+        lane_results: Dict[str, Any] = {}
+        try:
+            if self.workers > 1:
+                self._extract_pool = ProcessPoolExecutor(max_workers=self.workers)
+            with ThreadPoolExecutor(max_workers=len(lanes) or 1, thread_name_prefix='harvest') as executor:
+                for results in executor.map(self._harvest_lane, lanes.values()):
+                    lane_results.update(results)
+        finally:
+            if self._extract_pool is not None:
+                self._extract_pool.shutdown()
+                self._extract_pool = None
+        
         for country in self.tso_sources.keys():
-            logger.info(f"\n{'='*50}")
-            logger.info(f"HARVESTING: {country}")
-            logger.info(f"{'='*50}")
+            country_results = lane_results.get(country)
+            if country_results is None:
+                continue
             
             try:
-                country_results = self.harvest_country_documents(country)
                 all_results['countries'][country] = country_results
                 
                 # Update summary
@@ -537,6 +1189,28 @@ class TSODocumentHarvester:
         
         return all_results
 
+    def _harvest_lane(self, countries: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Harvest the countries of one TSO host one after another
+        
+        Args:
+            countries: Countries whose TSO sites share a host
+            
+        Returns:
+            Harvest results per country (countries that failed are left out)
+        """
+        results = {}
+        for country in countries:
+            logger.info(f"\n{'='*50}")
+            logger.info(f"HARVESTING: {country}")
+            logger.info(f"{'='*50}")
+            
+            try:
+                results[country] = self.harvest_country_documents(country)
+            except Exception as e:
+                logger.error(f"Error harvesting {country}: {e}")
+        return results
+
     def export_harvest_results(self, results: Dict[str, Any], 
                              output_file: str = None) -> str:
         """
@@ -567,7 +1241,7 @@ def main():
     print("TSO DOCUMENT HARVESTER FOR GRID QUEUE INTELLIGENCE")
     print("="*60)
     
-    harvester = TSODocumentHarvester()
+    harvester = TSODocumentHarvester(text_cache=PageTextCache(), workers=os.cpu_count() or 1)
     
     # Run comprehensive harvest
     results = harvester.harvest_all_countries()